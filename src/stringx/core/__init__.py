@@ -6,6 +6,7 @@ Este pacote contém os módulos centrais do String-X, incluindo:
 - banner: Exibição de banners ASCII
 - basemodule: Classe base para módulos auxiliares
 - command: Processamento e execução de comandos
+- dns_cache: Cache de DNS em processo para clientes HTTP assíncronos
 - filelocal: Manipulação de arquivos locais
 - format: Formatação e manipulação de dados
 - func_format: Processamento de funções em templates
@@ -17,6 +18,7 @@ Este pacote contém os módulos centrais do String-X, incluindo:
 - retry: Mecanismo de repetição para operações com falha
 - style_cli: Interface estilizada para CLI
 - thread_process: Processamento paralelo com threads
+- ttl_cache: Cache em disco com expiração para consultas remotas
 - upgrade_manager: Gerenciador de atualizações
 - user_agent_generator: Geração de User-Agents específicos por plataforma
 """
\ No newline at end of file
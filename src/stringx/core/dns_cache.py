@@ -0,0 +1,278 @@
+"""
+Cache de DNS em processo para clientes HTTP assíncronos.
+
+Este módulo implementa um cache de resolução de nomes com TTL que pode ser
+acoplado a clientes httpx através de um backend de rede do httpcore. Cada
+host é resolvido uma única vez por período de TTL, evitando chamadas
+repetidas a getaddrinfo no threadpool quando novas conexões são abertas
+para hosts já conhecidos.
+"""
+# Biblioteca padrão
+import time
+import socket
+import asyncio
+import ipaddress
+from itertools import zip_longest
+from typing import Dict, List, Tuple, Optional, Iterable, Any
+
+# Bibliotecas de terceiros
+import httpx
+import httpcore
+
+# Intervalo entre tentativas de conexão concorrentes (RFC 8305, "happy eyeballs");
+# o mesmo valor usado pelo anyio quando o httpcore recebe o nome do host
+_HAPPY_EYEBALLS_DELAY = 0.25
+
+
+class DNSCache:
+    """
+    Cache de resolução DNS com expiração por TTL.
+
+    Attributes:
+        ttl (float): Tempo de vida (segundos) de cada entrada resolvida
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        """
+        Inicializa o cache de DNS.
+
+        Args:
+            ttl (float): Tempo de vida das entradas em segundos
+        """
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+        # Resoluções em andamento, por (host, loop): requisições concorrentes
+        # ao mesmo host frio aguardam uma única chamada a getaddrinfo
+        self._pending: Dict[Tuple[str, asyncio.AbstractEventLoop], asyncio.Future] = {}
+
+    @staticmethod
+    def _is_ip_literal(host: str) -> bool:
+        """Verifica se o host já é um endereço IP."""
+        try:
+            ipaddress.ip_address(host)
+            return True
+        except ValueError:
+            return False
+
+    async def resolve(self, host: str, port: int) -> Tuple[str, ...]:
+        """
+        Resolve um host para seus endereços IP usando o cache quando possível.
+
+        Args:
+            host (str): Nome do host
+            port (int): Porta de destino
+
+        Returns:
+            Tuple[str, ...]: Endereços resolvidos, na ordem do getaddrinfo
+                (ou apenas o próprio host se já for IP)
+
+        Raises:
+            OSError: Se a resolução falhar
+        """
+        if self._is_ip_literal(host):
+            return (host,)
+
+        # O endereço não depende da porta, então a entrada é por host
+        entry = self._entries.get(host)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        loop = asyncio.get_running_loop()
+        pending_key = (host, loop)
+        pending = self._pending.get(pending_key)
+        if pending is None:
+            pending = loop.create_task(self._lookup(loop, host, port))
+            self._pending[pending_key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(pending_key, None))
+        # shield: o cancelamento de uma requisição não cancela a resolução
+        # compartilhada com as demais
+        return await asyncio.shield(pending)
+
+    async def _lookup(self, loop: asyncio.AbstractEventLoop, host: str, port: int) -> Tuple[str, ...]:
+        """Executa getaddrinfo e grava todos os endereços (sem repetição) no cache."""
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+        if not addresses:
+            raise OSError(f"Nenhum endereço encontrado para {host}")
+        self._entries[host] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    async def prefetch(self, hosts: Iterable[str], port: int = 443) -> None:
+        """
+        Resolve vários hosts concorrentemente para aquecer o cache.
+        
+        Falhas são ignoradas; a conexão real tentará resolver novamente e
+        reportará o erro no contexto da requisição.
+        
+        Args:
+            hosts (Iterable[str]): Nomes a resolver
+            port (int): Porta de destino
+        """
+        await asyncio.gather(
+            *(self.resolve(host, port) for host in set(hosts)),
+            return_exceptions=True
+        )
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache."""
+        self._entries.clear()
+        self._pending.clear()
+
+
+def _interleave_families(addresses: Tuple[str, ...]) -> List[str]:
+    """Alterna IPv6/IPv4 a partir da família do primeiro endereço (RFC 8305)."""
+    ipv6 = [address for address in addresses if ':' in address]
+    ipv4 = [address for address in addresses if ':' not in address]
+    first, second = (ipv6, ipv4) if ':' in addresses[0] else (ipv4, ipv6)
+    return [address for pair in zip_longest(first, second) for address in pair if address]
+
+
+class CachedDNSBackend(httpcore.AsyncNetworkBackend):
+    """
+    Backend de rede do httpcore que resolve hosts através de um DNSCache.
+
+    A conexão TCP é aberta diretamente nos IPs resolvidos, em tentativas
+    escalonadas alternando IPv6/IPv4 (como o happy eyeballs do anyio no
+    backend padrão); o SNI/verificação TLS continua usando o nome original,
+    pois o httpcore o informa separadamente no handshake.
+    """
+
+    def __init__(self, cache: DNSCache):
+        """
+        Inicializa o backend.
+
+        Args:
+            cache (DNSCache): Cache de DNS a ser utilizado
+        """
+        self._cache = cache
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._cache.resolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+        
+        if len(addresses) == 1:
+            return await self._backend.connect_tcp(
+                addresses[0],
+                port,
+                timeout=timeout,
+                local_address=local_address,
+                socket_options=socket_options,
+            )
+        return await self._connect_happy_eyeballs(
+            _interleave_families(addresses), port, timeout, local_address, socket_options
+        )
+
+    async def _connect_happy_eyeballs(
+        self,
+        addresses: Iterable[str],
+        port: int,
+        timeout: Optional[float],
+        local_address: Optional[str],
+        socket_options: Optional[Iterable[Any]],
+    ) -> httpcore.AsyncNetworkStream:
+        """
+        Disputa a conexão entre os endereços, iniciando um a cada
+        _HAPPY_EYEBALLS_DELAY (ou assim que a tentativa anterior falhar).
+
+        Um endereço que descarta pacotes (AAAA sem rota IPv6) custa apenas o
+        intervalo, não o timeout inteiro. O timeout vale para a disputa toda.
+
+        Raises:
+            httpcore.ConnectError | httpcore.ConnectTimeout: Último erro se
+                nenhum endereço aceitar a conexão
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        queue = list(addresses)
+        attempts = set()
+        winner = None
+        last_error = None
+        try:
+            while winner is None and (queue or attempts):
+                if queue:
+                    remaining = None if deadline is None else max(deadline - loop.time(), 0.0)
+                    attempts.add(asyncio.ensure_future(self._backend.connect_tcp(
+                        queue.pop(0),
+                        port,
+                        timeout=remaining,
+                        local_address=local_address,
+                        socket_options=socket_options,
+                    )))
+                done, attempts = await asyncio.wait(
+                    attempts,
+                    timeout=_HAPPY_EYEBALLS_DELAY if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if winner is None:
+                            winner = task.result()
+                        else:
+                            await task.result().aclose()
+                    elif isinstance(error, (httpcore.ConnectError, httpcore.ConnectTimeout)):
+                        last_error = error
+                    else:
+                        raise error
+        except BaseException:
+            if winner is not None:
+                await winner.aclose()
+            raise
+        finally:
+            # Cancela as tentativas perdedoras e fecha as que conectaram no meio tempo
+            for task in attempts:
+                task.cancel()
+            for result in await asyncio.gather(*attempts, return_exceptions=True):
+                if not isinstance(result, BaseException):
+                    await result.aclose()
+        if winner is None:
+            raise last_error
+        return winner
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# Cache compartilhado por todo o processo
+dns_cache = DNSCache()
+
+
+def build_cached_transport(cache: Optional[DNSCache] = None, **kwargs) -> httpx.AsyncHTTPTransport:
+    """
+    Cria um AsyncHTTPTransport do httpx que utiliza o cache de DNS.
+
+    Args:
+        cache (DNSCache): Cache a ser utilizado (padrão: cache do processo)
+        **kwargs: Parâmetros repassados ao httpx.AsyncHTTPTransport
+                  (verify, limits, proxy, http2, ...)
+
+    Returns:
+        httpx.AsyncHTTPTransport: Transporte configurado
+    """
+    transport = httpx.AsyncHTTPTransport(**kwargs)
+    pool = getattr(transport, '_pool', None)
+    # O httpx não expõe o backend de rede: depende de atributos internos do
+    # httpx/httpcore (versões fixadas no pyproject.toml e verificadas em
+    # tests/test_dns_cache.py). Se a estrutura mudar, o transporte continua
+    # funcionando com o resolvedor padrão
+    if pool is not None and hasattr(pool, '_network_backend'):
+        pool._network_backend = CachedDNSBackend(cache or dns_cache)
+    return transport
@@ -6,16 +6,28 @@ para realizar requisições paralelas, manipular respostas e processar resultado
 de forma eficiente.
 """
 # Biblioteca padrão
+import atexit
 import asyncio
-from typing import Optional, Dict, Any, List, Tuple, Set, Union
+import threading
+from typing import Optional, Dict, Any, List, Tuple, Set, Union, Coroutine
 
 # Bibliotecas de terceiros
 import httpx
 from httpx import Response, HTTPError, ConnectError, TimeoutException, ReadTimeout, ConnectTimeout
+try:
+    import h2  # noqa: F401 - necessário para http2=True no httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+try:
+    import uvloop  # Event loop em C (libuv), usado quando instalado
+except ImportError:
+    uvloop = None
 
 # Módulos locais
 from stringx.core.format import Format
 from stringx.core.style_cli import StyleCli
+from stringx.core.dns_cache import build_cached_transport
 
 class HTTPClient:
     """
@@ -43,14 +55,77 @@ class HTTPClient:
         'timeout', 'extensions', 'content', 'data', 'files', 'json'
     }
     
-    def __init__(self, **kwargs):
+    # Parâmetros do cliente que pertencem ao transporte (pool de conexões)
+    TRANSPORT_PARAMS = {'verify', 'cert', 'http1', 'http2', 'limits', 'proxy', 'trust_env'}
+    
+    def __init__(self, persistent: bool = False, **kwargs):
         """
         Inicializa o cliente HTTP assíncrono.
         
         Args:
+            persistent (bool): Se True, reutiliza as sessões httpx (pool de
+                conexões, keep-alive e cache de DNS) entre requisições. As
+                sessões ficam presas ao event loop em que foram criadas e
+                devem ser fechadas com aclose().
             **kwargs: Argumentos de configuração para o cliente HTTP
         """
         self._cli = StyleCli()
+        self._persistent = persistent
+        self._sessions: Dict[str, httpx.AsyncClient] = {}
+    
+    def _get_session(self, client_params: Dict[str, Any]) -> httpx.AsyncClient:
+        """
+        Retorna uma sessão persistente para a configuração de cliente informada.
+        
+        Parâmetros de requisição (headers, timeout, ...) são enviados a cada
+        chamada, então apenas a configuração de conexão (proxy, verify, ...)
+        diferencia as sessões.
+        
+        Args:
+            client_params (Dict[str, Any]): Parâmetros do cliente httpx
+            
+        Returns:
+            httpx.AsyncClient: Sessão reutilizável
+        """
+        session_params = {k: v for k, v in client_params.items() if k not in self.REQUEST_PARAMS}
+        key = repr(sorted((k, repr(v)) for k, v in session_params.items()))
+        
+        session = self._sessions.get(key)
+        if session is None or session.is_closed:
+            if 'transport' not in session_params:
+                transport_params = {
+                    k: session_params.pop(k) for k in list(session_params) if k in self.TRANSPORT_PARAMS
+                }
+                transport_params.setdefault('limits', httpx.Limits(
+                    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30
+                ))
+                session_params['transport'] = build_cached_transport(**transport_params)
+            session = httpx.AsyncClient(**session_params)
+            self._sessions[key] = session
+        return session
+    
+    def get_session(self, **client_params) -> httpx.AsyncClient:
+        """
+        Retorna a sessão persistente para a configuração de conexão informada.
+        
+        Para módulos que fazem as requisições diretamente na sessão httpx.
+        Parâmetros de requisição (headers, timeout, follow_redirects, ...)
+        não fazem parte da sessão e devem ser passados a cada requisição.
+        
+        Args:
+            **client_params: Parâmetros do cliente httpx (verify, proxy, limits, ...)
+            
+        Returns:
+            httpx.AsyncClient: Sessão reutilizável
+        """
+        return self._get_session(client_params)
+    
+    async def aclose(self) -> None:
+        """Fecha todas as sessões persistentes abertas."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.aclose()
         
     @staticmethod
     def _get_title(html: str) -> str:
@@ -114,6 +189,9 @@ class HTTPClient:
             HTTPError: Erro na comunicação HTTP
         """
         client_params, request_params = self._split_params(kwargs)
+        
+        if self._persistent:
+            return await self._get_session(client_params).get(url, **request_params)
             
         async with httpx.AsyncClient(**client_params) as client:
             return await client.get(url, **request_params)
@@ -133,6 +211,9 @@ class HTTPClient:
             HTTPError: Erro na comunicação HTTP
         """
         client_params, request_params = self._split_params(kwargs)
+        
+        if self._persistent:
+            return await self._get_session(client_params).post(url, **request_params)
             
         async with httpx.AsyncClient(**client_params) as client:
             return await client.post(url, **request_params)
@@ -203,4 +284,107 @@ class HTTPClient:
             return []
         except Exception as e:
             self._cli.print_error(f"Erro na coleta: {e}")
-            return []
\ No newline at end of file
+            return []
+
+
+# Event loop e cliente compartilhados por todo o processo. O loop roda em uma
+# thread dedicada e as threads de trabalho (ThreadPoolExecutor) submetem
+# corrotinas a ele, então um único pool de conexões (e sessões HTTP/2) serve
+# todos os módulos e alvos, em vez de um pool frio por thread.
+_shared_runtime: Optional[Tuple[asyncio.AbstractEventLoop, HTTPClient, threading.Thread]] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_runtime() -> Tuple[asyncio.AbstractEventLoop, HTTPClient]:
+    """
+    Retorna o event loop e o HTTPClient compartilhados do processo.
+    
+    Ambos são criados no primeiro uso (com inicialização protegida por lock)
+    e reutilizados por todas as threads, amortizando handshakes TLS, DNS e a
+    criação de conexões entre domínios. Se o uvloop estiver instalado, o loop
+    compartilhado é um loop do uvloop.
+    
+    Returns:
+        Tuple[asyncio.AbstractEventLoop, HTTPClient]: Loop e cliente do processo
+    """
+    global _shared_runtime
+    runtime = _shared_runtime
+    if runtime is None:
+        with _shared_lock:
+            if _shared_runtime is None:
+                loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='stringx-http-loop', daemon=True)
+                thread.start()
+                _shared_runtime = (loop, HTTPClient(persistent=True), thread)
+            runtime = _shared_runtime
+    return runtime[0], runtime[1]
+
+
+def run_in_shared_loop(coro: Coroutine) -> Any:
+    """
+    Executa uma corrotina no event loop compartilhado e aguarda o resultado.
+    
+    Deve ser chamada a partir de threads de trabalho, nunca de dentro do
+    próprio loop compartilhado (o que causaria deadlock).
+    
+    Args:
+        coro (Coroutine): Corrotina a ser executada
+        
+    Returns:
+        Any: Resultado da corrotina
+        
+    Raises:
+        RuntimeError: Se chamada a partir da thread do loop compartilhado
+    """
+    loop, _ = get_shared_runtime()
+    if threading.current_thread() is _shared_runtime[2]:
+        coro.close()
+        raise RuntimeError("run_in_shared_loop chamado de dentro do loop compartilhado")
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        # KeyboardInterrupt na thread chamadora: cancela a tarefa no loop,
+        # abortando o I/O em andamento em vez de deixá-la rodando sozinha
+        future.cancel()
+        raise
+
+
+async def await_in_shared_loop(coro: Coroutine) -> Any:
+    """
+    Aguarda uma corrotina no event loop compartilhado a partir de qualquer loop.
+    
+    Versão assíncrona de run_in_shared_loop para chamadores que já estão em
+    um event loop: a corrotina roda no loop compartilhado (onde vivem as
+    sessões httpx) sem bloquear o loop do chamador. Dentro do próprio loop
+    compartilhado a corrotina é aguardada diretamente.
+    
+    Args:
+        coro (Coroutine): Corrotina a ser executada
+        
+    Returns:
+        Any: Resultado da corrotina
+    """
+    loop, _ = get_shared_runtime()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+@atexit.register
+def _close_shared_runtime() -> None:
+    """Fecha a sessão e o event loop compartilhados ao encerrar o processo."""
+    global _shared_runtime
+    with _shared_lock:
+        runtime, _shared_runtime = _shared_runtime, None
+    if runtime is None:
+        return
+    loop, client, thread = runtime
+    try:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not loop.is_running():
+        loop.close()
@@ -0,0 +1,115 @@
+"""
+Cache em disco com expiração (TTL) para resultados de consultas remotas.
+
+Este módulo implementa o decorador ttl_cache, que grava o resultado de uma
+função (síncrona ou assíncrona) em um arquivo JSON sob ~/.cache/stringx e o
+reutiliza enquanto o arquivo for mais novo que o TTL. É útil para consultas
+a serviços com limite de requisições repetidas ao longo de listas de alvos.
+"""
+# Biblioteca padrão
+import os
+import json
+import time
+import hashlib
+import inspect
+import functools
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+# Módulos locais
+from stringx.config import setting
+
+# Diretório raiz dos caches em disco
+CACHE_ROOT = Path.home() / '.cache' / 'stringx'
+
+
+def ttl_cache(ttl: int = 21600, namespace: str = 'default') -> Callable:
+    """
+    Decorador de cache em disco com TTL para funções e métodos.
+
+    Em métodos de módulos (objetos com 'options'), o cache pode ser desligado
+    pela opção 'cache' e o TTL sobrescrito por 'cache_ttl'. A configuração
+    STRX_ENABLE_CACHING desliga o cache globalmente. Resultados vazios ou
+    None não são gravados.
+
+    Args:
+        ttl (int): Tempo de vida padrão das entradas em segundos
+        namespace (str): Subdiretório do cache (ex: nome do módulo)
+
+    Returns:
+        Callable: Decorador
+    """
+    directory = CACHE_ROOT / namespace
+
+    def decorator(func: Callable) -> Callable:
+        def _params(args: tuple) -> Tuple[bool, float]:
+            enabled = bool(getattr(setting, 'STRX_ENABLE_CACHING', True))
+            max_age = ttl
+            if args and hasattr(args[0], 'options'):
+                options = getattr(args[0], 'options')
+                enabled = enabled and bool(options.get('cache', True))
+                max_age = options.get('cache_ttl', ttl) or ttl
+            return enabled, max_age
+
+        def _path(args: tuple, kwargs: dict) -> Path:
+            # Ignora self em métodos de módulos para compartilhar entre instâncias
+            call_args = args[1:] if args and hasattr(args[0], 'options') else args
+            raw = repr((func.__qualname__, call_args, sorted(kwargs.items())))
+            return directory / f"{hashlib.sha1(raw.encode()).hexdigest()}.json"
+
+        def _load(path: Path, max_age: float) -> Optional[Any]:
+            try:
+                if time.time() - path.stat().st_mtime > max_age:
+                    return None
+                with path.open(encoding='utf-8') as f:
+                    payload = json.load(f)
+            except (OSError, ValueError):
+                return None
+            value = payload.get('value')
+            return set(value) if payload.get('set') else value
+
+        def _store(path: Path, value: Any) -> None:
+            if not value:
+                return
+            is_set = isinstance(value, (set, frozenset))
+            payload = {'set': is_set, 'value': sorted(value) if is_set else value}
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(json.dumps(payload), encoding='utf-8')
+                os.replace(tmp, path)
+            except (OSError, TypeError, ValueError):
+                tmp.unlink(missing_ok=True)
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            enabled, max_age = _params(args)
+            if not enabled:
+                return await func(*args, **kwargs)
+            path = _path(args, kwargs)
+            cached = _load(path, max_age)
+            if cached is not None:
+                return cached
+            result = await func(*args, **kwargs)
+            _store(path, result)
+            return result
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            enabled, max_age = _params(args)
+            if not enabled:
+                return func(*args, **kwargs)
+            path = _path(args, kwargs)
+            cached = _load(path, max_age)
+            if cached is not None:
+                return cached
+            result = func(*args, **kwargs)
+            _store(path, result)
+            return result
+
+        if inspect.iscoroutinefunction(func):
+            return async_wrapper
+        return sync_wrapper
+
+    return decorator
@@ -20,9 +20,9 @@ import re
 import asyncio
 import signal
 import time
-from typing import List, Set, Tuple
+from itertools import chain
+from typing import Any, AsyncIterator, List, Set, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
-from collections import deque
 
 # Bibliotecas de terceiros
 import httpx
@@ -31,6 +31,52 @@ from bs4 import BeautifulSoup
 # Módulos locais
 from stringx.core.basemodule import BaseModule
 from stringx.core.format import Format
+from stringx.core.dns_cache import build_cached_transport
+from stringx.core.http_async import HTTP2_AVAILABLE
+
+# Parâmetros de tracking removidos da query string em uma única varredura
+_TRACKING_PARAMS_RE = re.compile(
+    r'(?:^|&)(?:utm_source|utm_medium|utm_campaign|utm_term|utm_content|gclid|fbclid)=[^&]*'
+)
+
+
+def _split_netloc_path(url: str) -> Tuple[str, str]:
+    """
+    Separa netloc e path de uma URL absoluta sem usar urlparse.
+    
+    Localiza o fim do esquema (``://``), o primeiro ``/``, ``?`` ou ``#``
+    seguinte para delimitar o netloc, e então o primeiro ``?`` ou ``#``
+    para delimitar o path.
+    
+    Args:
+        url: URL absoluta (http/https)
+        
+    Returns:
+        Tupla (netloc, path)
+    """
+    start = url.find('://')
+    if start == -1:
+        return "", ""
+    start += 3
+    
+    size = len(url)
+    netloc_end = size
+    for sep in '/?#':
+        idx = url.find(sep, start, netloc_end)
+        if idx != -1:
+            netloc_end = idx
+    
+    if netloc_end == size or url[netloc_end] != '/':
+        return url[start:netloc_end], ""
+    
+    path_end = size
+    for sep in '?#':
+        idx = url.find(sep, netloc_end, path_end)
+        if idx != -1:
+            path_end = idx
+    
+    return url[start:netloc_end], url[netloc_end:path_end]
+
 
 class WebSpider(BaseModule):
     """
@@ -84,43 +130,47 @@ class WebSpider(BaseModule):
             'include_patterns': str(),        # Padrões regex para incluir URLs
             'exclude_patterns': str(),        # Padrões regex para excluir URLs
             'concurrent_requests': 3,         # Número de requisições simultâneas (reduzido para memory safety)
+            'http2': True,                    # Usar HTTP/2 (multiplexação) quando o servidor suportar
+            'keepalive_expiry': 60,           # Tempo (s) para manter conexões ociosas abertas
             'extract_from_js': True,          # Extrair URLs de arquivos JavaScript
             'extract_from_css': False,        # Extrair URLs de arquivos CSS
             'respect_robots': False,          # Respeitar robots.txt (básico)
+            'sort_output': False,             # Ordenar URLs coletadas na saída
             'debug': False,                   # Modo de debug
             'proxy': None,                    # Proxy para requisições
             'retry': 1,                       # Número de tentativas por URL (reduzido)
             'retry_delay': None,              # Atraso entre tentativas
         }
         
-        # Regex patterns para extração de URLs otimizadas
-        self.url_patterns = [
-            # URLs padrão HTTP/HTTPS - mais rápido
-            re.compile(r'https?://[^\s<>"\']+', re.IGNORECASE),
-            # URLs em atributos - compilado uma vez para múltiplos atributos
-            re.compile(r'(?:href|src|action)=["\']([^"\']+)["\']', re.IGNORECASE),
-            # URLs em JavaScript - otimizado
-            re.compile(r'(?:window\.location|location\.href)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE),
-            # URLs em meta refresh
-            re.compile(r'content=["\'][^"\']*url=([^"\']+)["\']', re.IGNORECASE),
-        ]
+        # Regex de extração de URLs por tipo de conteúdo: cada página passa
+        # apenas pelos padrões relevantes. Cada padrão é uma varredura própria
+        # (não uma alternação única), pois os matches de uma alternação não se
+        # sobrepõem: um atributo consumiria a URL absoluta contida no seu valor
+        absolute = re.compile(r'https?://[^\s<>"\']+', re.IGNORECASE)
+        attribute = re.compile(r'(?:href|src|action)=["\']([^"\']+)["\']', re.IGNORECASE)
+        js_location = re.compile(r'(?:window\.location|location\.href)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+        meta_refresh = re.compile(r'content=["\'][^"\']*url=([^"\']+)["\']', re.IGNORECASE)
+        css_url = re.compile(r'url\(\s*["\']?([^"\')\s]+)["\']?\s*\)', re.IGNORECASE)
+        self.url_patterns = {
+            'html': (absolute, attribute, js_location, meta_refresh),
+            'js': (absolute, js_location),
+            'css': (absolute, css_url),
+        }
         
         # Cache compilado para padrões de validação
-        self._exclude_ext_pattern = None
-        self._include_ext_pattern = None
+        self._exclude_exts = None
+        self._include_exts = None
         self._exclude_pattern = None
         self._include_pattern = None
         
-        # Conjunto para controlar URLs já visitadas - usando deque para performance
+        # Conjuntos para controlar URLs já visitadas e coletadas
         self.visited_urls: Set[str] = set()
         self.collected_urls: Set[str] = set()
         self.url_status: dict = {}  # Store URL -> HTTP status code mapping
-        self.url_queue: deque = deque()
         self.base_domain: str = ""
         
         # Cache de rate limiting
         self._last_request_time = 0
-        self._request_timestamps = deque(maxlen=100)
         
         # Memory protection
         self._total_content_size = 0
@@ -129,6 +179,12 @@ class WebSpider(BaseModule):
         # Interrupt handling
         self._interrupted = False
         self._shutdown_event = None
+        
+        # Fila opcional para streaming de (url, status) durante iter_urls()
+        self._url_stream = None
+    
+    # Estado de execução (O(URLs visitadas)) que não precisa ser serializado
+    _RUNTIME_STATE = ('visited_urls', 'collected_urls', 'url_status')
     
     def __getstate__(self):
         """Custom pickle state to handle module references."""
@@ -136,6 +192,9 @@ class WebSpider(BaseModule):
         # Remove the unpicklable entries (module reference)
         if 'setting' in state:
             del state['setting']
+        # Drop crawl state so the pickle stays O(options), not O(URLs)
+        for key in self._RUNTIME_STATE:
+            state.pop(key, None)
         return state
     
     def __setstate__(self, state):
@@ -144,6 +203,10 @@ class WebSpider(BaseModule):
         # Restore the setting module
         from stringx.config import setting
         self.setting = setting
+        # Recreate empty crawl state
+        self.visited_urls = set()
+        self.collected_urls = set()
+        self.url_status = {}
         
     def _normalize_url(self, url: str, base_url: str = "") -> str:
         """
@@ -175,30 +238,24 @@ class WebSpider(BaseModule):
             url = url.split('#')[0]
         
         # Remover parâmetros de tracking comuns se configurado
-        if self.options.get('remove_tracking', True):
-            tracking_params = ['utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 'gclid', 'fbclid']
+        if self.options.get('remove_tracking', True) and '?' in url:
             parsed = urlparse(url)
             if parsed.query:
-                query_params = [param for param in parsed.query.split('&') 
-                              if not any(param.startswith(track + '=') for track in tracking_params)]
-                query = '&'.join(query_params)
-                url = urlunparse(parsed._replace(query=query))
+                query = _TRACKING_PARAMS_RE.sub('', parsed.query).lstrip('&')
+                if query != parsed.query:
+                    url = urlunparse(parsed._replace(query=query))
         
         return url
     
     def _compile_validation_patterns(self):
         """Compila padrões de validação uma vez para reutilização."""
-        if self._exclude_ext_pattern is None:
+        if self._exclude_exts is None:
             exclude_ext = self.options.get('exclude_extensions', '').split(',')
-            if exclude_ext and exclude_ext != ['']:
-                pattern = r'\.(?:' + '|'.join(re.escape(ext.strip()) for ext in exclude_ext if ext.strip()) + ')$'
-                self._exclude_ext_pattern = re.compile(pattern, re.IGNORECASE)
+            self._exclude_exts = frozenset(ext.strip().lower() for ext in exclude_ext if ext.strip())
         
-        if self._include_ext_pattern is None:
+        if self._include_exts is None:
             include_ext = self.options.get('file_extensions', '').split(',')
-            if include_ext and include_ext != ['']:
-                pattern = r'\.(?:' + '|'.join(re.escape(ext.strip()) for ext in include_ext if ext.strip()) + ')$'
-                self._include_ext_pattern = re.compile(pattern, re.IGNORECASE)
+            self._include_exts = frozenset(ext.strip().lower() for ext in include_ext if ext.strip())
         
         if self._exclude_pattern is None:
             exclude_patterns = self.options.get('exclude_patterns', '')
@@ -236,32 +293,31 @@ class WebSpider(BaseModule):
                 self.log_debug(f"[!] URL muito longa ({len(url)} chars): {url[:100]}...")
             return False
         
-        # Parse uma vez e reutiliza
-        try:
-            parsed = urlparse(url)
-            if not parsed.netloc:
-                return False
-        except Exception:
+        # Separar netloc e path por varredura de caracteres (evita urlparse)
+        netloc, path = _split_netloc_path(url)
+        if not netloc:
             return False
         
         # Verificar se é domínio externo
         if not self.options.get('include_external', False):
-            if self.base_domain and parsed.netloc.lower() != self.base_domain.lower():
+            if self.base_domain and netloc.lower() != self.base_domain.lower():
                 return False
         
         # Compilar padrões se necessário
         self._compile_validation_patterns()
         
-        path_lower = parsed.path.lower()
-        
-        # Verificar extensões excluídas (usando regex compilada)
-        if self._exclude_ext_pattern and self._exclude_ext_pattern.search(path_lower):
-            return False
-        
-        # Verificar extensões incluídas (usando regex compilada)
-        if self._include_ext_pattern:
-            has_extension = '.' in path_lower.split('/')[-1]
-            if has_extension and not self._include_ext_pattern.search(path_lower):
+        # Extensão do último segmento do path (vazia se não houver)
+        last_segment = path[path.rfind('/') + 1:]
+        dot = last_segment.rfind('.')
+        if dot != -1:
+            ext = last_segment[dot + 1:].lower()
+            
+            # Verificar extensões excluídas (lookup em frozenset)
+            if ext in self._exclude_exts:
+                return False
+            
+            # Verificar extensões incluídas (lookup em frozenset)
+            if self._include_exts and ext not in self._include_exts:
                 return False
         
         # Verificar padrões de exclusão (usando regex compilada)
@@ -274,36 +330,33 @@ class WebSpider(BaseModule):
         
         return True
     
-    def _extract_urls_from_content(self, content: str, base_url: str) -> List[str]:
+    def _extract_urls_from_content(self, content: str, base_url: str, kind: str = 'html') -> Set[str]:
         """
-        Extrai URLs do conteúdo HTML (versão otimizada).
+        Extrai URLs do conteúdo HTML, JavaScript ou CSS (versão otimizada).
         
         Args:
-            content: Conteúdo HTML da página
+            content: Conteúdo da página
             base_url: URL base para resolver URLs relativas
+            kind: Tipo de conteúdo ('html', 'js' ou 'css')
             
         Returns:
-            Lista de URLs encontradas
+            Conjunto de URLs encontradas
         """
         urls = set()
         
         # Usar regex primeiro (mais rápido) e depois BeautifulSoup se necessário
         try:
-            # Extração rápida com regex patterns otimizadas
-            for pattern in self.url_patterns:
-                matches = pattern.findall(content)
-                for match in matches:
-                    # match pode ser uma tupla ou string dependendo do padrão
-                    if isinstance(match, tuple):
-                        match = match[0] if match else ""
-                    
+            # Extração rápida com os padrões do tipo de conteúdo; cada padrão
+            # tem no máximo um grupo, então findall devolve strings
+            for pattern in self.url_patterns.get(kind, self.url_patterns['html']):
+                for match in pattern.findall(content):
                     if match and len(match) > 3:  # Skip muito curtas
                         normalized = self._normalize_url(match, base_url)
                         if normalized and self._is_valid_url(normalized):
                             urls.add(normalized)
             
-            # Se não encontrou muitas URLs com regex, tenta BeautifulSoup
-            if len(urls) < 5:
+            # Se não encontrou muitas URLs com regex, tenta BeautifulSoup (apenas HTML)
+            if kind == 'html' and len(urls) < 5:
                 try:
                     # Usar parser mais rápido do BeautifulSoup
                     soup = BeautifulSoup(content, 'html.parser')
@@ -340,9 +393,27 @@ class WebSpider(BaseModule):
             if self.options.get('debug'):
                 self.log_debug(f"[x] Erro ao extrair URLs: {e}")
         
-        return list(urls)
+        return urls
+    
+    def _content_kind(self, content_type: str) -> str:
+        """
+        Classifica o Content-Type para escolher a regex de extração.
+        
+        Args:
+            content_type: Valor do cabeçalho Content-Type (lowercase)
+            
+        Returns:
+            'html', 'js', 'css' ou string vazia se o conteúdo deve ser ignorado
+        """
+        if any(ct in content_type for ct in ('text/html', 'text/plain', 'application/xhtml')):
+            return 'html'
+        if 'javascript' in content_type or 'ecmascript' in content_type:
+            return 'js' if self.options.get('extract_from_js', False) else ''
+        if 'text/css' in content_type:
+            return 'css' if self.options.get('extract_from_css', False) else ''
+        return ''
     
-    async def _fetch_url(self, session: httpx.AsyncClient, url: str) -> Tuple[str, str, bool, int]:
+    async def _fetch_url(self, session: httpx.AsyncClient, url: str) -> Tuple[str, str, bool, int, str]:
         """
         Faz requisição HTTP para uma URL.
         
@@ -351,7 +422,7 @@ class WebSpider(BaseModule):
             url: URL a ser requisitada
             
         Returns:
-            Tupla (url, content, success, status_code)
+            Tupla (url, content, success, status_code, kind)
         """
         try:
             if self.options.get('debug'):
@@ -363,38 +434,39 @@ class WebSpider(BaseModule):
             # Store the status code for this URL
             self.url_status[url] = status_code
             
-            # Verificar se é conteúdo HTML/texto
+            # Verificar se é conteúdo HTML/texto (ou JS/CSS, se configurado)
             content_type = response.headers.get('content-type', '').lower()
-            if not any(ct in content_type for ct in ['text/html', 'text/plain', 'application/xhtml']):
+            kind = self._content_kind(content_type)
+            if not kind:
                 if self.options.get('debug'):
                     self.log_debug(f"[!] Tipo de conteúdo ignorado: {content_type}")
-                return url, "", False, status_code
+                return url, "", False, status_code, ""
             
             # Verificar tamanho do conteúdo usando configuração
             max_content_size = self.options.get('max_content_size', 5242880)  # 5MB default
             if len(response.content) > max_content_size:
                 if self.options.get('debug'):
                     self.log_debug(f"[!] Conteúdo muito grande, ignorando: {len(response.content)} bytes")
-                return url, "", False, status_code
+                return url, "", False, status_code, kind
             
             content = response.text
-            return url, content, True, status_code
+            return url, content, True, status_code, kind
             
         except httpx.TimeoutException:
             if self.options.get('debug'):
                 self.log_debug(f"[!] Timeout na requisição: {url}")
             self.url_status[url] = 408  # Request Timeout
-            return url, "", False, 408
+            return url, "", False, 408, ""
         except httpx.RequestError as e:
             if self.options.get('debug'):
                 self.log_debug(f"[x] Erro de requisição para {url}: {e}")
             self.url_status[url] = 0  # Connection error
-            return url, "", False, 0
+            return url, "", False, 0, ""
         except Exception as e:
             if self.options.get('debug'):
                 self.log_debug(f"[x] Erro inesperado para {url}: {e}")
             self.url_status[url] = -1  # Unknown error
-            return url, "", False, -1
+            return url, "", False, -1, ""
     
     def _setup_signal_handlers(self):
         """
@@ -461,28 +533,30 @@ class WebSpider(BaseModule):
                         await asyncio.sleep(delay - (current_time - self._last_request_time))
                     self._last_request_time = current_time
                 
-                _, content, success, status_code = await self._fetch_url(session, url)
+                _, content, success, status_code, kind = await self._fetch_url(session, url)
+                if self._url_stream is not None:
+                    self._url_stream.put_nowait((url, status_code))
                 
                 if success and content:
                     # Track content size for memory protection
                     self._total_content_size += len(content)
                     
                     # Extrair URLs do conteúdo
-                    found_urls = self._extract_urls_from_content(content, url)
+                    found_urls = self._extract_urls_from_content(content, url, kind)
                     
-                    # Batch add para evitar locks frequentes
-                    valid_new_urls = []
-                    for found_url in found_urls:
-                        if (found_url not in self.visited_urls and 
-                            found_url not in self.collected_urls and 
-                            len(self.collected_urls) < self.options.get('max_urls', 100)):
-                            valid_new_urls.append(found_url)
-                            self.collected_urls.add(found_url)
+                    # Diferença de conjuntos em C em vez de um .add por URL;
+                    # collected_urls contém todas as visitadas, então basta
+                    # descontá-lo para descartar duplicadas
+                    budget = self.options.get('max_urls', 100) - len(self.collected_urls)
+                    if budget <= 0:
+                        return
+                    valid_new_urls = list(found_urls - self.collected_urls)[:budget]
+                    self.collected_urls.update(valid_new_urls)
                     
                     # Adicionar em batch para reduzir contention
                     for valid_url in valid_new_urls[:50]:  # Limitar para evitar memory bloat
                         try:
-                            await batch_new_urls.put(valid_url, timeout=0.1)
+                            batch_new_urls.put_nowait(valid_url)
                         except asyncio.QueueFull:
                             break
         
@@ -528,6 +602,99 @@ class WebSpider(BaseModule):
         
         return new_urls
     
+    def _collected_list(self) -> List[str]:
+        """
+        Retorna as URLs coletadas, ordenadas apenas se 'sort_output' estiver ativo.
+        
+        Returns:
+            Lista de URLs coletadas
+        """
+        if self.options.get('sort_output', False):
+            return sorted(self.collected_urls)
+        return list(self.collected_urls)
+    
+    def _reset_crawl_state(self):
+        """
+        Limpa o estado de crawling deixado por execuções anteriores na mesma instância.
+        """
+        self.visited_urls.clear()
+        self.collected_urls.clear()
+        self.url_status.clear()
+        self._total_content_size = 0
+        self._processed_urls = 0
+    
+    async def iter_urls(self, start_url: str) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Executa o spider e entrega (url, status) à medida que as URLs são visitadas.
+        
+        URLs coletadas mas não visitadas (limite de profundidade ou de URLs)
+        são entregues ao final com o status conhecido ou 'N/A'. Falhas do
+        crawling são propagadas ao chamador em vez de truncar o resultado.
+        
+        Args:
+            start_url: URL inicial
+            
+        Yields:
+            Tupla (url, status_code)
+        """
+        self._reset_crawl_state()
+        queue: asyncio.Queue = asyncio.Queue()
+        self._url_stream = queue
+        crawl = asyncio.create_task(self._run_spider_async(start_url))
+        getter = None
+        emitted = set()
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter, crawl}, return_when=asyncio.FIRST_COMPLETED)
+                if getter not in done:
+                    break
+                url, status_code = getter.result()
+                emitted.add(url)
+                yield url, status_code
+            
+            # Re-levanta a exceção do crawling (e a marca como recuperada)
+            crawl.result()
+            
+            while not queue.empty():
+                url, status_code = queue.get_nowait()
+                emitted.add(url)
+                yield url, status_code
+            
+            for url in self.collected_urls - emitted:
+                yield url, self.url_status.get(url, 'N/A')
+        finally:
+            self._url_stream = None
+            if getter is not None and not getter.done():
+                getter.cancel()
+            if not crawl.done():
+                crawl.cancel()
+    
+    def _collected_lines(self) -> List[str]:
+        """
+        Formata as URLs já coletadas como "url; status" (usado após interrupção).
+        
+        Returns:
+            Linhas "url; status"
+        """
+        get_status = self.url_status.get
+        return [f"{url}; {get_status(url, 'N/A')}" for url in self._collected_list()]
+    
+    async def _stream_results(self, start_url: str) -> List[str]:
+        """
+        Consome iter_urls() formatando cada URL com seu status conforme chega.
+        
+        Args:
+            start_url: URL inicial
+            
+        Returns:
+            Linhas "url; status", ordenadas por URL apenas se 'sort_output' estiver ativo
+        """
+        if self.options.get('sort_output', False):
+            results = sorted([item async for item in self.iter_urls(start_url)])
+            return [f"{url}; {status}" for url, status in results]
+        return [f"{url}; {status}" async for url, status in self.iter_urls(start_url)]
+    
     async def _run_spider_async(self, start_url: str) -> List[str]:
         """
         Executa o spider de forma assíncrona.
@@ -551,7 +718,8 @@ class WebSpider(BaseModule):
         
         limits = httpx.Limits(
             max_connections=self.options.get('concurrent_requests', 5),
-            max_keepalive_connections=self.options.get('concurrent_requests', 5)
+            max_keepalive_connections=self.options.get('concurrent_requests', 5),
+            keepalive_expiry=self.options.get('keepalive_expiry', 60)
         )
         
         headers = {
@@ -562,19 +730,22 @@ class WebSpider(BaseModule):
             'Connection': 'keep-alive',
         }
         
+        # Transporte com cache de DNS (TTL de 5 minutos) compartilhado no processo:
+        # cada host externo é resolvido uma vez, não a cada nova conexão
+        transport = build_cached_transport(
+            verify=self.options.get('verify_ssl', False),
+            limits=limits,
+            proxy=self.options.get('proxy') or None,
+            http2=bool(self.options.get('http2', True)) and HTTP2_AVAILABLE,
+        )
+        
         client_params = {
             'timeout': timeout,
             'follow_redirects': self.options.get('follow_redirects', True),
             'headers': headers,
-            'limits': limits,
-            'verify': self.options.get('verify_ssl', False),
+            'transport': transport,
         }
         
-        # Adicionar proxy se configurado
-        proxy = self.options.get('proxy')
-        if proxy:
-            client_params['proxies'] = proxy
-        
         # Inicializar com URL inicial
         current_urls = [start_url]
         max_depth = self.options.get('depth', 2)
@@ -602,15 +773,15 @@ class WebSpider(BaseModule):
                             self.log_debug("[!] Crawl level cancelled")
                         break
             
-            return sorted(list(self.collected_urls))
+            return self._collected_list()
         except asyncio.CancelledError:
             if self.options.get('debug'):
                 self.log_debug("[!] Spider async cancelled")
-            return sorted(list(self.collected_urls))
+            return self._collected_list()
         except Exception as e:
             if self.options.get('debug'):
                 self.log_debug(f"[x] Erro no spider async: {e}")
-            return sorted(list(self.collected_urls))
+            return self._collected_list()
     
     def run(self):
         """
@@ -619,11 +790,7 @@ class WebSpider(BaseModule):
         try:
             # Limpar resultados anteriores e reinicializar contadores
             self._result[self._get_cls_name()].clear()
-            self.visited_urls.clear()
-            self.collected_urls.clear()
-            self.url_status.clear()
-            self._total_content_size = 0
-            self._processed_urls = 0
+            self._reset_crawl_state()
             
             start_url = Format.clear_value(self.options.get('data', ''))
             if not start_url:
@@ -643,7 +810,7 @@ class WebSpider(BaseModule):
             
             # Executar spider - com manejo adequado do event loop
             start_time = time.time()
-            collected_urls = []
+            lines = []
             
             try:
                 # Setup signal handling for graceful shutdown
@@ -651,22 +818,22 @@ class WebSpider(BaseModule):
                 
                 # Use asyncio.run with proper KeyboardInterrupt handling
                 try:
-                    collected_urls = asyncio.run(self._run_spider_async(start_url))
+                    lines = asyncio.run(self._stream_results(start_url))
                 except KeyboardInterrupt:
                     self._interrupted = True
                     if self.options.get('debug'):
                         self.log_debug("Spider interrompido por KeyboardInterrupt")
-                    collected_urls = list(self.collected_urls)
+                    lines = self._collected_lines()
                     
             except KeyboardInterrupt:
                 if self.options.get('debug'):
                     self.log_debug("Spider interrompido pelo usuário (Ctrl+C)")
                 self._interrupted = True
-                collected_urls = list(self.collected_urls)  # Return what we have so far
+                lines = self._collected_lines()  # Return what we have so far
             except Exception as e:
                 if self.options.get('debug'):
                     self.log_debug(f"Erro durante execução do spider: {e}")
-                collected_urls = []
+                lines = []
             finally:
                 # Ensure any pending async operations are cleaned up
                 try:
@@ -683,26 +850,23 @@ class WebSpider(BaseModule):
             
             end_time = time.time()
             
-            if collected_urls:
+            if lines:
                 # Formatar resultados
-                result_lines = []
+                header = []
                 
                 if self.options.get('debug'):
                     status = "interrompido" if self._interrupted else "concluído"
-                    result_lines.append(f"# Spider {status} em {end_time - start_time:.2f}s")
-                    result_lines.append(f"# URLs coletadas: {len(collected_urls)}")
-                    result_lines.append(f"# URLs visitadas: {len(self.visited_urls)}")
-                    result_lines.append("")
-                
-                # Format URLs with HTTP status codes
-                for url in collected_urls:
-                    status_code = self.url_status.get(url, 'N/A')
-                    result_lines.append(f"{url}; {status_code}")
+                    header = [
+                        f"# Spider {status} em {end_time - start_time:.2f}s",
+                        f"# URLs coletadas: {len(lines)}",
+                        f"# URLs visitadas: {len(self.visited_urls)}",
+                        "",
+                    ]
                 
-                self.set_result("\n".join(result_lines))
+                self.set_result("\n".join(chain(header, lines)))
                 
                 if self.options.get('debug'):
-                    self.log_debug(f"Spider coletou {len(collected_urls)} URLs")
+                    self.log_debug(f"Spider coletou {len(lines)} URLs")
             else:
                 # Even if no URLs collected, show the start URL with its status
                 start_status = self.url_status.get(start_url, 'N/A')
@@ -20,11 +20,93 @@ de subdomínios, incluindo:
 - Técnicas passivas que não geram tráfego direto para o alvo
 - Consolidação e deduplicação de resultados de múltiplas fontes
 """
+import re
+import ssl
+import sys
+import json
+import heapq
 import asyncio
+from itertools import groupby
+from typing import List
+from urllib.parse import urlsplit
+
+# Bibliotecas de terceiros
+import httpx
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import brotli  # noqa: F401 - habilita a decodificação 'br' no httpx
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
 
 from stringx.core.basemodule import BaseModule
-from stringx.core.http_async import HTTPClient
+from stringx.core.dns_cache import dns_cache
+from stringx.core.http_async import HTTP2_AVAILABLE, get_shared_runtime, run_in_shared_loop
 from stringx.core.retry import retry_operation
+from stringx.core.ttl_cache import ttl_cache
+
+# Decodificador JSON: orjson quando disponível, senão a biblioteca padrão
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Cabeçalhos compartilhados (somente leitura) entre todas as requisições
+_UA = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+_HDR_JSON = {'User-Agent': _UA, 'Accept': 'application/json', 'Accept-Encoding': _ACCEPT_ENCODING}
+_HDR_HTML = {'User-Agent': _UA, 'Accept-Encoding': _ACCEPT_ENCODING, 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'}
+
+# Fontes passivas de subdomínios: nome -> (URL, cabeçalhos, método parser)
+SOURCES = {
+    'crtsh': (
+        'https://crt.sh/?q=%25.{domain}&output=json',
+        _HDR_JSON,
+        '_parse_crtsh',
+    ),
+    'certspotter': (
+        'https://api.certspotter.com/v1/issuances?domain={domain}&include_subdomains=true&expand=dns_names',
+        _HDR_JSON,
+        '_parse_certspotter',
+    ),
+    'hackertarget': (
+        'https://api.hackertarget.com/hostsearch/?q={domain}',
+        _HDR_HTML,
+        '_parse_hackertarget',
+    ),
+    'alienvault': (
+        'https://otx.alienvault.com/api/v1/indicators/domain/{domain}/passive_dns',
+        _HDR_JSON,
+        '_parse_alienvault',
+    ),
+    'anubis': (
+        'https://jldc.me/anubis/subdomains/{domain}',
+        _HDR_JSON,
+        '_parse_anubis',
+    ),
+    'rapiddns': (
+        'https://rapiddns.io/subdomain/{domain}?full=1',
+        _HDR_HTML,
+        '_parse_rapiddns',
+    ),
+}
+
+# Host de cada fonte, para pré-resolução de DNS
+_SOURCE_HOSTS = {name: urlsplit(source[0]).hostname for name, source in SOURCES.items()}
+
+# Contexto TLS construído uma única vez e reutilizado em todas as conexões.
+# A verificação de certificado fica desabilitada deliberadamente, como no
+# padrão do HTTPClient (proxies de interceptação são comuns nesse uso).
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+# Limites do pool da sessão persistente: com HTTP/2 as consultas a uma mesma
+# fonte são multiplexadas em uma única conexão TCP/TLS por host
+_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60)
+
+# Células de tabela com nomes de host (RapidDNS)
+_RAPIDDNS_CELL_RE = re.compile(r'<td>\s*([A-Za-z0-9_.\-]+)\s*</td>')
+
 
 class SubdomainEnum(BaseModule):
     """
@@ -33,13 +115,11 @@ class SubdomainEnum(BaseModule):
     
     def __init__(self):
         super().__init__()
-        # Instância do cliente HTTP assíncrono
-        self.request = HTTPClient()
         self.meta = {
             'name': 'Subdomain Enumerator',
             'author': 'MrCl0wn',
             'version': '1.0',
-            'description': 'Enumera subdomínios usando CT logs e bruteforce',
+            'description': 'Enumera subdomínios usando CT logs e fontes passivas',
             'type': 'collector'
         ,
             'example': './strx -l domains.txt -st "echo {STRING}" -module "clc:subdomain" -pm'
@@ -47,13 +127,27 @@ class SubdomainEnum(BaseModule):
         # Opções configuráveis do módulo
         self.options = {
             'data': str(),  # Domínio alvo
-            'methods': ['crtsh', 'certspotter', 'hackertarget'],
-            'timeout': 10,            'proxy': str(),  # Proxies para requisições (opcional)
+            'methods': list(SOURCES),  # Fontes consultadas (chaves de SOURCES)
+            'timeout': 10,
+            'cache': True,           # Reutilizar resultados por fonte/domínio em disco
+            'cache_ttl': 21600,      # Validade do cache em segundos (6h)
+            'max_concurrent': 8,     # Fontes consultadas simultaneamente
+            'proxy': str(),  # Proxies para requisições (opcional)
             'debug': False,  # Modo de debug para mostrar informações detalhadas
             'retry': 0,              # Número de tentativas de requisição
             'retry_delay': None,        # Atraso entre tentativas de requisição    
         }
     
+    @property
+    def request(self):
+        """
+        Cliente HTTP persistente compartilhado pelo processo.
+        
+        Não é armazenado na instância para que o módulo continue podendo ser
+        copiado (deepcopy/pickle) pelo carregador de módulos.
+        """
+        return get_shared_runtime()[1]
+    
     def run(self):
         """
         Executa a enumeração de subdomínios.
@@ -61,155 +155,212 @@ class SubdomainEnum(BaseModule):
         Utiliza múltiplas fontes para encontrar subdomínios do domínio especificado.
         """
         try:
-            domain = self.options.get("data", "").strip()
+            # Normalizado uma vez por execução: fontes, cache em disco e filtro
+            # de escopo passam a receber sempre a mesma forma do domínio
+            domain = self.options.get("data", "").strip().lower().rstrip('.')
             if not domain:
                 self.log_debug("Domínio não fornecido.")
                 return
             
             # Limpar resultados anteriores para evitar acúmulo
-            self._result[self._get_cls_name()].clear()
+            self._clear_results()
                 
-            subdomains = set()
-            methods = self.options.get('methods', ['crtsh'])
-            
-            for method in methods:
-                try:
-                    if method == 'crtsh':
-                        subs = self._crtsh_search(domain)
-                    elif method == 'certspotter':
-                        subs = self._certspotter_search(domain)
-                    elif method == 'hackertarget':
-                        subs = self._hackertarget_search(domain)
-                    else:
-                        continue
-                        
-                    subdomains.update(subs)
-                except Exception:
-                    continue
+            # Todas as fontes consultadas concorrentemente no event loop
+            # compartilhado do processo (reutiliza conexões entre domínios e threads)
+            subdomains = run_in_shared_loop(self._run_async(domain))
                 
             if not subdomains:
                 self.log_debug("Nenhum subdomínio encontrado")
                 return
                             
-            # Deduplicar e formatar resultados
-            subdomains = sorted(list(set(subdomains)))
+            # Resultado já ordenado e deduplicado pelo merge das fontes
             self.log_debug(f"Subdomínios encontrados: {len(subdomains)}")            
-            self.set_result("\n".join(subdomains))
+            # Um resultado por subdomínio (o filtro -ifm e o encadeamento
+            # passam a atuar por nome, e não sobre um bloco único de texto)
+            self.set_result(subdomains)
         except Exception as e:
             self.handle_error(e, "Erro Subdomain")
 
-    @retry_operation
-    def _crtsh_search(self, domain: str) -> set:
-        """Busca subdomínios no crt.sh"""
-        url = f"https://crt.sh/?q=%25.{domain}&output=json"
-
-        # Configurar parâmetros para HTTPClient
-        kwargs = {
-            'headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'application/json',
-            },
-            'proxy': self.options.get('proxy') if self.options.get('proxy') else None,  
-            'timeout': self.options.get('timeout', 30),
-            'follow_redirects': True,
-        }
+    async def _run_async(self, domain: str) -> List[str]:
+        """
+        Consulta todas as fontes configuradas concorrentemente.
         
-        try:
-        # Executar requisição assíncrona
-            async def make_request():
-                return await self.request.send_request([url], **kwargs)
-            
-            response = asyncio.run(make_request())[0]
-            
-            subdomains = set()
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    for entry in data:
-                        name = entry.get('name_value', '')
-                        if '\n' in name:
-                            subdomains.update(name.split('\n'))
-                        else:
-                            subdomains.add(name)
-                except:
-                    pass
+        A enumeração é limitada por I/O, então a latência total passa a ser a
+        da fonte mais lenta em vez da soma de todas. Falhas em uma fonte não
+        cancelam as demais. Cada fonte devolve uma lista já ordenada, então
+        a consolidação é um merge linear (heapq.merge) com deduplicação dos
+        vizinhos iguais, sem reordenar a união.
+        
+        Args:
+            domain (str): Domínio alvo
             
-            return {sub.strip() for sub in subdomains if sub.strip() and domain in sub}
+        Returns:
+            List[str]: Subdomínios ordenados e únicos de todas as fontes
+        """
+        methods = [m for m in self.options.get('methods', ['crtsh']) if m in SOURCES]
+        semaphore = asyncio.Semaphore(max(1, int(self.options.get('max_concurrent', 8))))
         
-        except Exception as e:
-            self.handle_error(e, "Erro ao conectar ao crt.sh")
-            raise ValueError(e)
+        # Resolve todos os hosts das fontes de uma vez (no cache de DNS do
+        # processo) em vez de cada um só quando sua requisição sai do semáforo.
+        # Com proxy a resolução é feita pelo próprio proxy.
+        if not self.options.get('proxy'):
+            await dns_cache.prefetch(_SOURCE_HOSTS[m] for m in methods)
         
+        async def bounded_search(method: str) -> List[str]:
+            async with semaphore:
+                return await self._source_search(method, domain)
+        
+        results = await asyncio.gather(
+            *(bounded_search(method) for method in methods),
+            return_exceptions=True
+        )
+        
+        sorted_results = []
+        for method, result in zip(methods, results):
+            if isinstance(result, BaseException) or not result:
+                self.log_debug(f"Fonte {method} não retornou resultados")
+                continue
+            # Entradas antigas do cache em disco podem ter sido gravadas como set
+            sorted_results.append(result if isinstance(result, list) else sorted(result))
+        return [name for name, _ in groupby(heapq.merge(*sorted_results))]
+
+    @ttl_cache(ttl=21600, namespace='subdomain')
     @retry_operation
-    def _certspotter_search(self, domain: str) -> set:
-        """Busca subdomínios no CertSpotter"""
-        url = f"https://api.certspotter.com/v1/issuances?domain={domain}&include_subdomains=true&expand=dns_names"
+    async def _source_search(self, method: str, domain: str) -> List[str]:
+        """Busca subdomínios em uma das fontes de SOURCES (lista ordenada)"""
+        url_template, headers, parser = SOURCES[method]
+        url = url_template.format(domain=domain)
 
         # Configurar parâmetros para HTTPClient
         kwargs = {
-            'headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'application/json',
-            },
-            'proxy': self.options.get('proxy') if self.options.get('proxy') else None,  
+            'headers': headers,
+            'proxy': self.options.get('proxy') or None,
             'timeout': self.options.get('timeout', 30),
             'follow_redirects': True,
+            'verify': _SSL_CTX,
+            'http2': HTTP2_AVAILABLE,
+            'limits': _LIMITS,
         }
-        
+
         try:
-            # Executar requisição assíncrona
-            async def make_request():
-                return await self.request.send_request([url], **kwargs)
-            
-            response = asyncio.run(make_request())[0]
-            
-            subdomains = set()
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    for entry in data:
-                        dns_names = entry.get('dns_names', [])
-                        subdomains.update(dns_names)
-                except:
-                    pass
-            
-            return {sub for sub in subdomains if domain in sub}
+            response = (await self.request.send_request([url], **kwargs))[0]
+            # Ordenado aqui, uma vez por fonte; acertos do cache já vêm ordenados
+            return sorted(getattr(self, parser)(response, domain))
         except Exception as e:
-            self.log_debug(f"Erro ao conectar ao CertSpotter: {str(e)}")
+            self.log_debug(f"Erro ao conectar ao {method}: {str(e)}")
             raise ValueError(e)
-        
-    @retry_operation
-    def _hackertarget_search(self, domain: str) -> set:
-        """Busca subdomínios no HackerTarget"""
-        url = f"https://api.hackertarget.com/hostsearch/?q={domain}"
-
-        # Configurar parâmetros para HTTPClient
-        kwargs = {
-            'headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            },
-            'proxy': self.options.get('proxy') if self.options.get('proxy') else None,
-            'timeout': self.options.get('timeout', 30),
-            'follow_redirects': True,
-        }
 
-        try:     
-            # Executar requisição assíncrona
-            async def make_request():
-                return await self.request.send_request([url], **kwargs)
-            
-            response = asyncio.run(make_request())[0]
+    @staticmethod
+    def _filter_scope(names, domain: str) -> set:
+        """
+        Mantém apenas nomes iguais ao domínio ou terminados em '.domínio'.
+        
+        Substitui a checagem por substring ('domain in sub'), que aceitava
+        falsos positivos como 'evilexample.com.attacker.tld'. Os nomes são
+        normalizados (strip + lowercase) em uma única passada, o que também
+        deduplica resultados com caixa diferente entre fontes.
+        
+        Os parsers passam geradores, então a extração e o filtro acontecem
+        na mesma passada sobre a resposta.
+        
+        Args:
+            names: Nomes candidatos (qualquer iterável de str)
+            domain (str): Domínio alvo
             
-            subdomains = set()
-            if response.status_code == 200:
-                lines = response.text.strip().split('\n')
-                for line in lines:
-                    if ',' in line:
-                        subdomain = line.split(',')[0].strip()
-                        subdomains.add(subdomain)
+        Returns:
+            set: Nomes dentro do escopo do domínio
+        """
+        domain = domain.lower()
+        suffix = '.' + domain
+        in_scope = set()
+        for raw in names:
+            name = raw.strip().lower()
+            if name and (name == domain or name.endswith(suffix)):
+                # Interning: nomes repetidos entre fontes viram um único objeto,
+                # e o merge/deduplicação compara por identidade antes do conteúdo
+                in_scope.add(sys.intern(name))
+        return in_scope
+
+    def _load_json(self, response, source: str):
+        """
+        Decodifica o corpo JSON de uma resposta de fonte.
+        
+        Páginas HTML de erro/limite de requisições são descartadas pelo
+        Content-Type ou, sem ele, olhando só o primeiro byte significativo,
+        antes de qualquer parse.
+        
+        Args:
+            response: Resposta HTTP da fonte
+            source (str): Nome da fonte (para log)
             
-            return subdomains
-        except Exception as e:
-            self.log_debug(f"Erro ao conectar ao HackerTarget: {str(e)}")
-            raise ValueError(e)
+        Returns:
+            Objeto decodificado, ou None se o corpo não for JSON válido
+        """
+        if response.headers.get('content-type', '').startswith('text/html'):
+            self.log_debug(f"{source}: resposta HTML, ignorando")
+            return None
+        content = response.content
+        if content[:64].lstrip()[:1] not in (b'[', b'{'):
+            self.log_debug(f"{source}: resposta não é JSON, ignorando")
+            return None
+        try:
+            # Decodifica direto dos bytes (orjson é 2-4x mais rápido que json)
+            return _json_loads(content)
+        except ValueError as e:
+            # orjson.JSONDecodeError e json.JSONDecodeError herdam de ValueError
+            self.log_debug(f"{source}: JSON inválido: {e}")
+            return None
+
+    def _parse_crtsh(self, response, domain: str) -> set:
+        """Extrai subdomínios da resposta JSON do crt.sh"""
+        if response.status_code != 200:
+            return set()
+        data = self._load_json(response, 'crtsh') or ()
+        # splitlines() cobre entradas com um ou vários nomes; o gerador é
+        # filtrado direto em _filter_scope, sem um set intermediário
+        return self._filter_scope(
+            (name for entry in data for name in entry.get('name_value', '').splitlines()),
+            domain
+        )
+
+    def _parse_certspotter(self, response, domain: str) -> set:
+        """Extrai subdomínios da resposta JSON do CertSpotter"""
+        if response.status_code != 200:
+            return set()
+        data = self._load_json(response, 'certspotter') or ()
+        return self._filter_scope(
+            (name for entry in data for name in entry.get('dns_names', [])),
+            domain
+        )
+
+    def _parse_hackertarget(self, response, domain: str) -> set:
+        """Extrai subdomínios da resposta CSV do HackerTarget"""
+        if response.status_code != 200:
+            return set()
+        # partition corta só o primeiro campo (host,ip) sem dividir o resto
+        return self._filter_scope(
+            (host for host, sep, _ in (line.partition(',') for line in response.text.splitlines()) if sep),
+            domain
+        )
+
+    def _parse_alienvault(self, response, domain: str) -> set:
+        """Extrai subdomínios do passive DNS da AlienVault OTX"""
+        if response.status_code != 200:
+            return set()
+        data = self._load_json(response, 'alienvault') or {}
+        return self._filter_scope(
+            (entry.get('hostname', '') for entry in data.get('passive_dns', [])),
+            domain
+        )
+
+    def _parse_anubis(self, response, domain: str) -> set:
+        """Extrai subdomínios da lista JSON do Anubis"""
+        if response.status_code != 200:
+            return set()
+        return self._filter_scope(self._load_json(response, 'anubis') or (), domain)
+
+    def _parse_rapiddns(self, response, domain: str) -> set:
+        """Extrai subdomínios da tabela HTML do RapidDNS"""
+        if response.status_code != 200:
+            return set()
+        return self._filter_scope((m.group(1) for m in _RAPIDDNS_CELL_RE.finditer(response.text)), domain)
@@ -12,12 +12,13 @@ O módulo oferece:
 - Tratamento robusto de erros de conexão e timeout
 - Suporte a proxy e configurações de timeout
 - Filtragem automática de URLs inacessíveis
-- Fallback automático quando aiometer não está disponível
+- Fallback automático quando aiometer não está disponível (com token
+  bucket do aiolimiter, se instalado)
 - Formato de saída: {URL}; {HTTP_CODE}
 """
 import asyncio
-import signal
-from typing import List, Dict, Set, Tuple
+from functools import lru_cache, partial
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple, FrozenSet, Union
 from urllib.parse import urlparse
 import re
 
@@ -27,10 +28,98 @@ try:
     import aiometer
 except ImportError:
     aiometer = None
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
 
 # Módulos locais
 from stringx.core.basemodule import BaseModule
 from stringx.core.format import Format
+from stringx.core.http_async import HTTP2_AVAILABLE, get_shared_runtime, run_in_shared_loop
+
+# URLs http(s) embutidas em uma linha de entrada
+_URL_EXTRACT_RE = re.compile(r'https?://[^\s,;]+', re.IGNORECASE)
+
+# Presets de velocidade aplicados por _apply_speed_mode
+_SPEED_PRESETS = {
+    # Máxima velocidade - pode sobrecarregar alguns servidores
+    'fast': {
+        'timeout': 3,
+        'max_concurrent': 100,
+        'max_per_second': 200,
+        'delay': 0,
+        'retry_attempts': 1,
+        'retry_delay': 0.2,
+        'methods': 'HEAD',
+    },
+    # Balanço entre velocidade e compatibilidade
+    'balanced': {
+        'timeout': 5,
+        'max_concurrent': 50,
+        'max_per_second': 100,
+        'delay': 0,
+        'retry_attempts': 1,
+        'retry_delay': 0.5,
+        'methods': 'HEAD',
+    },
+    # Modo conservador - amigável com todos os servidores
+    'conservative': {
+        'timeout': 10,
+        'max_concurrent': 10,
+        'max_per_second': 20,
+        'delay': 0.2,
+        'retry_attempts': 2,
+        'retry_delay': 1.0,
+        'methods': 'HEAD,GET',
+    },
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_status_list(value: str) -> FrozenSet[int]:
+    """
+    Converte uma lista de códigos de status ("200,404,500") em um frozenset.
+    
+    Itens não numéricos são ignorados. O resultado é memorizado: cada
+    execução do módulo (uma por linha de entrada) reutiliza o mesmo conjunto.
+    
+    Args:
+        value: Códigos separados por vírgula
+        
+    Returns:
+        Conjunto de códigos de status
+    """
+    statuses = set()
+    for status in (value or '').split(','):
+        try:
+            statuses.add(int(status.strip()))
+        except ValueError:
+            continue
+    return frozenset(statuses)
+
+
+# Predicados de status montados por UrlChecker._refresh_filters. São funções
+# de módulo (com functools.partial) para que o módulo continue serializável.
+def _include_any(status_code: int) -> bool:
+    """Aceita qualquer status (show_all_attempts)."""
+    return True
+
+
+def _include_reachable(status_code: int) -> bool:
+    """Aceita qualquer resposta HTTP (caso padrão, sem filtros)."""
+    return status_code > 0
+
+
+def _include_filtered(include_errors: bool, allowed: FrozenSet[int], excluded: FrozenSet[int],
+                      status_code: int) -> bool:
+    """Aplica include_errors, status_filter e exclude_status."""
+    # Unreachable URLs (0, -1) are only kept with include_unreachable/include_errors
+    if status_code <= 0:
+        return include_errors
+    if allowed and status_code not in allowed:
+        return False
+    return status_code not in excluded
 
 
 class UrlChecker(BaseModule):
@@ -57,7 +146,7 @@ class UrlChecker(BaseModule):
             'description': 'Verifica status HTTP de URLs de forma assíncrona com aiometer (otimizado para velocidade)',
             'type': 'collector',
             'example': './strx -s "https://example.com" -st "echo {STRING}" -module "clc:url_check" -pm',
-            'output_format': '{ORIGINAL_URL} -> {FINAL_URL}; {HTTP_CODE}',
+            'output_format': '{URL}; {HTTP_CODE} (com show_final_url: {ORIGINAL_URL} -> {FINAL_URL}; {HTTP_CODE})',
             'speed_modes': {
                 'fast': 'Máxima velocidade (100+ concurrent, 200+ req/s)',
                 'balanced': 'Balanço velocidade/compatibilidade (50 concurrent, 100 req/s)',
@@ -67,7 +156,8 @@ class UrlChecker(BaseModule):
                 'include_errors': 'Inclui URLs com qualquer tipo de erro (códigos 0, -1)',
                 'include_unreachable': 'Inclui apenas URLs que não retornaram código HTTP',
                 'show_all_attempts': 'Mostra todas as URLs testadas, independente do resultado',
-                'show_final_url': 'Mostra URL final após redirecionamentos na saída'
+                'show_final_url': 'Segue redirecionamentos e mostra a URL final na saída',
+                'sort_output': 'Ordena a saída por URL ao final em vez de emitir cada resultado ao chegar'
             }
         }
         
@@ -85,13 +175,13 @@ class UrlChecker(BaseModule):
             'max_per_second': 100,            # Rate limit (requests per second) - aumentado para velocidade
             'user_agent': user_agent_value,   # User-Agent para requisições HTTP
             'verify_ssl': False,              # Verificar certificados SSL
-            'follow_redirects': True,        # Seguir redirecionamentos (False para velocidade)
-            'max_redirects': 3,               # Máximo de redirecionamentos
+            'follow_redirects': True,        # Seguir redirecionamentos (só com show_final_url)
+            'max_redirects': 3,               # Máximo de redirecionamentos (quando seguindo)
             'methods': 'HEAD',                # Método HTTP para teste (HEAD é mais rápido que GET)
             'include_errors': False,          # Incluir URLs com erro (código 0, -1)
             'include_unreachable': False,     # Incluir URLs que não retornaram nenhum código HTTP
             'show_all_attempts': False,       # Mostrar todas as URLs testadas, independente do resultado
-            'show_final_url': True,           # Mostrar URL final após redirecionamentos
+            'show_final_url': False,          # Seguir redirecionamentos e mostrar a URL final (3xx é status final se False)
             'status_filter': str(),           # Filtrar por códigos de status (ex: "200,404,500")
             'exclude_status': str(),          # Excluir códigos de status específicos
             'retry_attempts': 1,              # Tentativas por URL (sem retry para velocidade)
@@ -99,6 +189,9 @@ class UrlChecker(BaseModule):
             'debug': False,                   # Modo debug
             'proxy': None,                    # Proxy para requisições
             'speed_mode': 'fast',         # Modo de velocidade: 'fast', 'balanced', 'conservative'
+            'http2': True,                    # Multiplexar requisições ao mesmo host via HTTP/2 (requer h2)
+            'strict_validation': False,       # Validar host com regex (domínio/localhost/IP) além da estrutura
+            'sort_output': False,             # Ordenar a saída por URL ao final (padrão: ordem de chegada)
         }
         
         # Apply speed mode presets
@@ -106,11 +199,12 @@ class UrlChecker(BaseModule):
         
         # Control structures
         self.url_results: Dict[str, Tuple[int, str]] = {}
-        self.failed_urls: Set[str] = set()
-        self.processed_count = 0
         self.interrupted = False
         
-        # URL validation regex
+        # Predicado de status montado a partir das opções (ver _refresh_filters)
+        self._filter_fn: Callable[[int], bool] = _include_reachable
+        
+        # URL validation regex (apenas com strict_validation)
         self.url_pattern = re.compile(
             r'^https?://'  # http:// or https://
             r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
@@ -123,6 +217,10 @@ class UrlChecker(BaseModule):
         """
         Valida se uma URL está bem formada.
         
+        Por padrão a checagem é apenas estrutural (esquema http/https e host
+        presente), já que os candidatos vêm de _URL_EXTRACT_RE; a regex
+        completa de host só é aplicada com a opção strict_validation.
+        
         Args:
             url: URL para validar
             
@@ -133,49 +231,64 @@ class UrlChecker(BaseModule):
             return False
         
         url = url.strip()
-        if not url.startswith(('http://', 'https://')):
-            return False
-        
         try:
             parsed = urlparse(url)
-            return bool(parsed.netloc) and self.url_pattern.match(url)
-        except Exception:
+        except ValueError:
+            return False
+        
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc or len(parsed.netloc) > 255:
             return False
+        
+        if self.options.get('strict_validation', False):
+            return bool(self.url_pattern.match(url))
+        return True
     
-    def _parse_urls_from_input(self, data: str) -> List[str]:
+    def _parse_urls_from_input(self, data: Union[str, List[str], Tuple[str, ...], set]) -> List[str]:
         """
         Extrai URLs válidas da entrada de dados.
         
+        Listas, tuplas e sets (uso programático/pipeline) já trazem uma URL
+        por item: cada item é apenas validado, sem a extração por regex.
+        
         Args:
-            data: String contendo URLs (separadas por linha ou vírgula)
+            data: String contendo URLs (separadas por linha ou vírgula) ou
+                  coleção de URLs
             
         Returns:
-            Lista de URLs válidas
+            Lista de URLs válidas, sem duplicatas e na ordem da entrada
         """
-        urls = []
+        # dict como conjunto ordenado: deduplica durante a leitura
+        urls: Dict[str, None] = {}
         
         if not data:
-            return urls
+            return []
         
-        # Split by newlines and process each line
-        lines = data.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        debug = self.options.get('debug')
         
-        for line in lines:
+        if isinstance(data, (list, tuple, set, frozenset)):
+            for url in data:
+                if self._is_valid_url(url):
+                    urls[url.strip()] = None
+                elif debug:
+                    self.log_debug(f"URL inválida ignorada: {url}")
+            return list(urls)
+        
+        # splitlines() trata \n, \r\n e \r em uma única passada
+        for line in data.splitlines():
             line = line.strip()
             if not line:
                 continue
             
             # Try regex first to find URLs in the line
-            import re
-            url_matches = re.findall(r'https?://[^\s,;]+', line, re.IGNORECASE)
+            url_matches = _URL_EXTRACT_RE.findall(line)
             
             if url_matches:
                 # Found URLs with regex
                 for url in url_matches:
                     url = url.strip().rstrip('.,;')
                     if self._is_valid_url(url):
-                        urls.append(url)
-                    elif self.options.get('debug'):
+                        urls[url] = None
+                    elif debug:
                         self.log_debug(f"URL inválida ignorada: {url}")
             else:
                 # Try splitting by comma
@@ -187,11 +300,35 @@ class UrlChecker(BaseModule):
                 for url_candidate in url_candidates:
                     url_candidate = url_candidate.strip()
                     if self._is_valid_url(url_candidate):
-                        urls.append(url_candidate)
-                    elif self.options.get('debug'):
+                        urls[url_candidate] = None
+                    elif debug:
                         self.log_debug(f"URL inválida ignorada: {url_candidate}")
         
-        return list(set(urls))  # Remove duplicates
+        return list(urls)
+    
+    def _refresh_filters(self):
+        """
+        Monta o predicado de status usado por _should_include_status.
+        
+        Executado uma vez no início de run(), já que as opções são definidas
+        depois da criação do módulo: status_filter/exclude_status viram
+        conjuntos de inteiros e as flags de inclusão escolhem um predicado
+        especializado, evitando consultar options a cada resposta.
+        """
+        allowed = _parse_status_list(str(self.options.get('status_filter') or ''))
+        excluded = _parse_status_list(str(self.options.get('exclude_status') or ''))
+        # include_unreachable e include_errors têm o mesmo efeito em códigos <= 0
+        include_errors = bool(
+            self.options.get('include_unreachable', False) or self.options.get('include_errors', False)
+        )
+        
+        # Show all attempts option overrides everything
+        if self.options.get('show_all_attempts', False):
+            self._filter_fn = _include_any
+        elif not (allowed or excluded or include_errors):
+            self._filter_fn = _include_reachable
+        else:
+            self._filter_fn = partial(_include_filtered, include_errors, allowed, excluded)
     
     def _should_include_status(self, status_code: int) -> bool:
         """
@@ -203,95 +340,24 @@ class UrlChecker(BaseModule):
         Returns:
             True se deve incluir o status
         """
-        # Show all attempts option overrides everything
-        if self.options.get('show_all_attempts', False):
-            return True
-        
-        # Check for unreachable URLs (status codes 0, -1)
-        if status_code <= 0:
-            # include_unreachable specifically for URLs that didn't return any HTTP code
-            if self.options.get('include_unreachable', False):
-                return True
-            # include_errors is the broader option for any error condition
-            if self.options.get('include_errors', False):
-                return True
-            # Otherwise exclude error codes
-            return False
-        
-        # For valid HTTP status codes (> 0), apply filtering
-        
-        # Check status filter
-        status_filter = self.options.get('status_filter', '').strip()
-        if status_filter:
-            allowed_statuses = []
-            for status in status_filter.split(','):
-                try:
-                    allowed_statuses.append(int(status.strip()))
-                except ValueError:
-                    continue
-            if allowed_statuses and status_code not in allowed_statuses:
-                return False
-        
-        # Check exclude status
-        exclude_status = self.options.get('exclude_status', '').strip()
-        if exclude_status:
-            excluded_statuses = []
-            for status in exclude_status.split(','):
-                try:
-                    excluded_statuses.append(int(status.strip()))
-                except ValueError:
-                    continue
-            if status_code in excluded_statuses:
-                return False
-        
-        return True
+        return self._filter_fn(status_code)
     
     def _apply_speed_mode(self):
         """
         Aplica presets de configuração baseados no modo de velocidade.
+        
+        Modos desconhecidos usam o preset 'balanced'.
         """
         speed_mode = self.options.get('speed_mode', 'balanced')
-        
-        if speed_mode == 'fast':
-            # Máxima velocidade - pode sobrecarregar alguns servidores
-            self.options.update({
-                'timeout': 3,
-                'max_concurrent': 100,
-                'max_per_second': 200,
-                'delay': 0,
-                'retry_attempts': 1,
-                'retry_delay': 0.2,
-                'methods': 'HEAD'
-            })
-            
-        elif speed_mode == 'balanced':
-            # Balanço entre velocidade e compatibilidade (padrão atual)
-            self.options.update({
-                'timeout': 5,
-                'max_concurrent': 50,
-                'max_per_second': 100,
-                'delay': 0,
-                'retry_attempts': 1,
-                'retry_delay': 0.5,
-                'methods': 'HEAD'
-            })
-            
-        elif speed_mode == 'conservative':
-            # Modo conservador - amigável com todos os servidores
-            self.options.update({
-                'timeout': 10,
-                'max_concurrent': 10,
-                'max_per_second': 20,
-                'delay': 0.2,
-                'retry_attempts': 2,
-                'retry_delay': 1.0,
-                'methods': 'HEAD,GET'
-            })
+        self.options.update(_SPEED_PRESETS.get(speed_mode, _SPEED_PRESETS['balanced']))
             
         if self.options.get('debug'):
             self.log_debug(f"Aplicando modo de velocidade: {speed_mode}")
     
-    async def _check_url_status(self, session: httpx.AsyncClient, url: str, method: str = 'GET') -> Tuple[str, int, str]:
+    async def _check_url_status(self, session: httpx.AsyncClient, url: str, method: str = 'GET',
+                                retry_attempts: int = 1, retry_delay: float = 1.0,
+                                debug: bool = False,
+                                request_kwargs: Optional[Dict[str, Any]] = None) -> Tuple[str, int, str]:
         """
         Verifica o status HTTP de uma URL.
         
@@ -299,33 +365,34 @@ class UrlChecker(BaseModule):
             session: Cliente HTTP assíncrono
             url: URL para verificar
             method: Método HTTP (GET, HEAD, etc)
+            retry_attempts: Tentativas por URL (já normalizado, >= 1)
+            retry_delay: Delay entre tentativas
+            debug: Registrar mensagens de debug
+            request_kwargs: Parâmetros por requisição (headers, timeout, follow_redirects)
             
         Returns:
             Tupla (original_url, status_code, final_url)
         """
+        # Única verificação de interrupção: uma vez iniciada, a requisição é
+        # interrompida por cancelamento da tarefa (ver run_in_shared_loop),
+        # que aborta também o I/O em andamento. CancelledError não é capturado.
         if self.interrupted:
             return url, -1, url
         
-        retry_attempts = max(1, self.options.get('retry_attempts', 1))
-        retry_delay = self.options.get('retry_delay', 1.0)
-        
+        request_kwargs = request_kwargs or {}
+        status_code = -1
         for attempt in range(retry_attempts):
-            if self.interrupted:
-                return url, -1, url, url
-            
             try:
-                if self.options.get('debug'):
+                if debug:
                     self.log_debug(f"Verificando {url} (tentativa {attempt + 1}/{retry_attempts})")
                 
-                # Check for interruption before making request
-                if self.interrupted:
-                    return url, -1, url
-                
-                response = await session.request(method, url)
+                response = await session.request(method, url, **request_kwargs)
                 status_code = response.status_code
-                final_url = str(response.url)
+                # Sem redirecionamento a URL final é a própria URL: evita
+                # reconstruir a string a partir de httpx.URL a cada requisição
+                final_url = str(response.url) if response.history else url
                 
-                if self.options.get('debug'):
+                if debug:
                     if final_url != url:
                         self.log_debug(f"{url} -> {final_url} ({status_code})")
                     else:
@@ -333,165 +400,174 @@ class UrlChecker(BaseModule):
                 
                 return url, status_code, final_url
                 
-            except asyncio.CancelledError:
-                # Task was cancelled, likely due to interruption
-                self.interrupted = True
-                return url, -1, url, url
-                
             except httpx.TimeoutException:
-                if self.options.get('debug'):
+                if debug:
                     self.log_debug(f"Timeout: {url}")
-                if attempt < retry_attempts - 1 and not self.interrupted:
-                    try:
-                        await asyncio.sleep(retry_delay)
-                    except asyncio.CancelledError:
-                        self.interrupted = True
-                        return url, -1, url, url
-                    continue
-                return url, 408, url  # Request Timeout
+                status_code = 408  # Request Timeout
                 
             except httpx.ConnectError:
-                if self.options.get('debug'):
+                if debug:
                     self.log_debug(f"Erro de conexão: {url}")
-                if attempt < retry_attempts - 1 and not self.interrupted:
-                    try:
-                        await asyncio.sleep(retry_delay)
-                    except asyncio.CancelledError:
-                        self.interrupted = True
-                        return url, -1, url, url
-                    continue
-                return url, 0, url  # Connection failed
+                status_code = 0  # Connection failed
                 
             except httpx.RequestError as e:
-                if self.options.get('debug'):
+                if debug:
                     self.log_debug(f"Erro de requisição para {url}: {e}")
-                if attempt < retry_attempts - 1 and not self.interrupted:
-                    try:
-                        await asyncio.sleep(retry_delay)
-                    except asyncio.CancelledError:
-                        self.interrupted = True
-                        return url, -1, url, url
-                    continue
-                return url, -1, url, url  # Request error
+                status_code = -1  # Request error
                 
             except Exception as e:
-                if self.options.get('debug'):
+                if debug:
                     self.log_debug(f"Erro inesperado para {url}: {e}")
-                if attempt < retry_attempts - 1 and not self.interrupted:
-                    try:
-                        await asyncio.sleep(retry_delay)
-                    except asyncio.CancelledError:
-                        self.interrupted = True
-                        return url, -1, url, url
-                    continue
-                return url, -1, url, url  # Unknown error
+                status_code = -1  # Unknown error
+            
+            if attempt < retry_attempts - 1:
+                await asyncio.sleep(retry_delay)
         
-        return url, -1, url  # All attempts failed
+        return url, status_code, url
     
-    async def _manual_url_processing(self, session: httpx.AsyncClient, urls: List[str], methods: List[str], results: Dict[str, Tuple[int, str]]) -> Dict[str, Tuple[int, str]]:
+    def _build_multi_method_probe(self, session: httpx.AsyncClient, methods: List[str],
+                                  retry_attempts: int, retry_delay: float, debug: bool,
+                                  request_kwargs: Dict[str, Any]) -> Callable[[str], Awaitable[Tuple[str, int, str]]]:
         """
-        Fallback manual URL processing when aiometer is not available.
+        Cria a sonda que tenta cada método em ordem até obter um status HTTP.
         
         Args:
-            session: HTTP client session
-            urls: List of URLs to process
-            methods: HTTP methods to try
-            results: Existing results dictionary
+            session: Cliente HTTP assíncrono
+            methods: Métodos HTTP a tentar, em ordem
+            retry_attempts: Tentativas por método
+            retry_delay: Delay entre tentativas
+            debug: Registrar mensagens de debug
+            request_kwargs: Parâmetros por requisição
             
         Returns:
-            Updated results dictionary with {url: (status_code, final_url)}
+            Função assíncrona url -> (url, status_code, final_url)
         """
-        # Control concurrency with semaphore
-        semaphore = asyncio.Semaphore(self.options.get('max_concurrent', 20))
-        delay = self.options.get('delay', 0.1)
-        
-        async def check_url_with_methods_and_delay(url: str) -> Tuple[str, int, str]:
-            """Check URL with methods and apply delay."""
+        async def probe(url: str) -> Tuple[str, int, str]:
+            """Check URL with multiple methods if needed."""
             if self.interrupted:
-                return url, -1, url, url
+                return url, -1, url
             
-            async with semaphore:
-                # Try each method until we get a valid response
-                for method in methods:
-                    if self.interrupted:
-                        return url, -1, url
-                    
-                    url_result, status_code, final_url = await self._check_url_status(session, url, method)
-                    
-                    # If we get a successful response, return it
-                    if status_code > 0:
-                        if delay > 0:
-                            try:
-                                await asyncio.sleep(delay)
-                            except asyncio.CancelledError:
-                                self.interrupted = True
-                                return url, -1, url
-                        return url_result, status_code, final_url
+            # Try each method until we get a valid response
+            for method in methods:
+                url_result, status_code, final_url = await self._check_url_status(
+                    session, url, method, retry_attempts, retry_delay, debug, request_kwargs
+                )
                 
-                # If all methods failed, return the last result
-                if delay > 0:
-                    try:
-                        await asyncio.sleep(delay)
-                    except asyncio.CancelledError:
-                        self.interrupted = True
-                        return url, -1, url, url
-                return url, status_code, final_url
-        
-        # Process URLs in chunks to avoid overwhelming the server
-        # Optimize chunk size based on concurrency for better performance\n        
-        max_concurrent = self.options.get('max_concurrent', 50)
-        chunk_size = min(max_concurrent * 2, len(urls))
-        for i in range(0, len(urls), chunk_size):
-            if self.interrupted:
-                if self.options.get('debug'):
-                    self.log_debug("[!] URL checking interrupted during manual processing")
-                break
-            
-            chunk = urls[i:i + chunk_size]
+                # If we get a successful response, return it
+                if status_code > 0:
+                    return url_result, status_code, final_url
             
-            if self.options.get('debug'):
-                self.log_debug(f"Processando chunk {i//chunk_size + 1}/{(len(urls)-1)//chunk_size + 1} ({len(chunk)} URLs)")
-            
-            # Create tasks for this chunk
-            tasks = [check_url_with_methods_and_delay(url) for url in chunk]
-            
-            try:
-                # Process chunk with proper cancellation handling
-                chunk_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in chunk_results:
-                    if self.interrupted:
-                        break
-                        
-                    if isinstance(result, Exception):
-                        if self.options.get('debug'):
-                            self.log_debug(f"Task exception: {result}")
-                        continue
-                    
-                    url, status_code, final_url = result
-                    if self._should_include_status(status_code):
-                        results[url] = (status_code, final_url)
-                    
-                    self.processed_count += 1
+            # If all methods failed, return the last result
+            return url, status_code, final_url
+        
+        return probe
+    
+    @staticmethod
+    def _format_result_line(url: str, status_code: int, final_url: str, show_final_url: bool) -> str:
+        """
+        Formata a linha de saída de uma URL verificada.
+        
+        Args:
+            url: URL original
+            status_code: Código de status HTTP
+            final_url: URL final após redirecionamentos
+            show_final_url: Exibir a URL final quando diferente da original
             
-            except asyncio.CancelledError:
-                if self.options.get('debug'):
-                    self.log_debug("[!] Tasks cancelled during manual processing")
-                self.interrupted = True
-                break
-            except Exception as e:
-                if self.options.get('debug'):
-                    self.log_debug(f"[!] Chunk processing error: {e}")
-                continue
+        Returns:
+            Linha no formato '{URL}; {HTTP_CODE}' ou '{URL} -> {FINAL_URL}; {HTTP_CODE}'
+        """
+        if show_final_url and final_url != url:
+            return f"{url} -> {final_url}; {status_code}"
+        return f"{url}; {status_code}"
+    
+    def _record_result(self, results: Dict[str, Tuple[int, str]], url: str, status_code: int,
+                       final_url: str, run_opts: Dict[str, Any]) -> None:
+        """
+        Registra uma URL aprovada pelos filtros e, sem sort_output, já a
+        emite no buffer de resultados do módulo.
+        
+        Args:
+            results: Dicionário de resultados da execução
+            url: URL original
+            status_code: Código de status HTTP
+            final_url: URL final após redirecionamentos
+            run_opts: Snapshot de opções criado por _check_urls_async
+        """
+        # O fallback manual após erro do aiometer pode repetir URLs já emitidas
+        if url in results:
+            return
+        results[url] = (status_code, final_url)
+        if not run_opts['sort_output']:
+            self._result[self._get_cls_name()].append(
+                self._format_result_line(url, status_code, final_url, run_opts['show_final_url'])
+            )
+    
+    async def _manual_url_processing(self, probe: Callable[[str], Awaitable[Tuple[str, int, str]]], urls: List[str], results: Dict[str, Tuple[int, str]], run_opts: Dict[str, Any]) -> Dict[str, Tuple[int, str]]:
+        """
+        Fallback manual URL processing when aiometer is not available.
+        
+        Args:
+            probe: Coroutine function checking one URL (built by _check_urls_async)
+            urls: List of URLs to process
+            results: Existing results dictionary
+            run_opts: Options snapshot taken by _check_urls_async
             
-            # Small delay between chunks only if delay is configured
-            delay = self.options.get('delay', 0)
-            if delay > 0 and not self.interrupted and i + chunk_size < len(urls):
+        Returns:
+            Updated results dictionary with {url: (status_code, final_url)}
+        """
+        debug = run_opts['debug']
+        max_concurrent = max(1, run_opts['max_concurrent'])
+        
+        # Com aiolimiter, o ritmo é um token bucket global de max_per_second
+        # (mesma semântica do caminho com aiometer) e o sleep fixo de 'delay'
+        # após cada URL deixa de ser necessário. Sem ele, mantém o 'delay'.
+        max_per_second = run_opts['max_per_second']
+        limiter = AsyncLimiter(max_per_second, 1) if AsyncLimiter is not None and max_per_second > 0 else None
+        delay = run_opts['delay']
+        
+        async def paced_probe(url: str) -> Tuple[str, int, str]:
+            """Run the probe under the rate limiter or followed by the delay."""
+            if limiter is not None:
+                async with limiter:
+                    return await probe(url)
+            result = await probe(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return result
+        
+        # Pool fixo de workers consumindo um iterador compartilhado: sempre há
+        # max_concurrent requisições em andamento, sem o bloqueio de fim de
+        # lote do antigo gather por chunks (a URL lenta de um lote não segura
+        # o próximo). O iterador basta como fila, pois tudo roda em um loop.
+        pending_urls = iter(urls)
+        include = self._filter_fn
+        
+        async def worker():
+            for url in pending_urls:
+                if self.interrupted:
+                    return
                 try:
-                    await asyncio.sleep(min(delay, 0.1))  # Cap delay to prevent slowdown
-                except asyncio.CancelledError:
-                    self.interrupted = True
-                    break
+                    url, status_code, final_url = await paced_probe(url)
+                except Exception as e:
+                    if debug:
+                        self.log_debug(f"Task exception: {e}")
+                    continue
+                
+                if include(status_code):
+                    self._record_result(results, url, status_code, final_url, run_opts)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(max_concurrent, len(urls)))]
+        try:
+            await asyncio.gather(*workers)
+        except asyncio.CancelledError:
+            if debug:
+                self.log_debug("[!] Tasks cancelled during manual processing")
+            self.interrupted = True
+            for task in workers:
+                task.cancel()
+        
+        if self.interrupted and debug:
+            self.log_debug("[!] URL checking interrupted during manual processing")
         
         return results
     
@@ -508,24 +584,46 @@ class UrlChecker(BaseModule):
         if not urls:
             return {}
         
-        results = {}
+        # Resultados parciais continuam acessíveis em url_results se a
+        # execução for interrompida
+        results = self.url_results
+        
+        # Snapshot das opções usadas por URL, lido uma única vez por execução
+        run_opts = {
+            'debug': self.options.get('debug', False),
+            'retry_attempts': max(1, self.options.get('retry_attempts', 1)),
+            'retry_delay': self.options.get('retry_delay', 1.0),
+            'max_concurrent': self.options.get('max_concurrent', 50),
+            'max_per_second': self.options.get('max_per_second', 10),
+            'delay': self.options.get('delay', 0),
+            'show_final_url': self.options.get('show_final_url', False),
+            'sort_output': self.options.get('sort_output', False),
+        }
+        debug = run_opts['debug']
+        retry_attempts = run_opts['retry_attempts']
+        retry_delay = run_opts['retry_delay']
         
         # Setup HTTP client with performance optimizations
         timeout_value = self.options.get('timeout', 5)
-        concurrent = self.options.get('max_concurrent', 50)
+        concurrent = run_opts['max_concurrent']
         
         timeout = httpx.Timeout(
             timeout=timeout_value,
             connect=min(timeout_value, 3),  # Faster connection timeout
             read=timeout_value,
-            pool=0.5  # Quick pool timeout
+            # Sem limite de espera por um slot do pool: a sessão é compartilhada
+            # entre threads e o pool atua como teto global de conexões; um
+            # timeout curto aqui virava falso erro (-1) sob carga
+            pool=None
         )
         
-        # Increase connection limits for better performance
+        # Pool alinhado à concorrência: nunca mais sockets do que requisições
+        # simultâneas, todos reaproveitáveis (keep-alive), e mantidos por
+        # minutos para que execuções seguidas reutilizem as conexões
         limits = httpx.Limits(
-            max_connections=concurrent * 2,        # Double the connections
-            max_keepalive_connections=concurrent,  # Keep connections alive
-            keepalive_expiry=30                    # Keep connections for 30s
+            max_connections=concurrent,
+            max_keepalive_connections=concurrent,
+            keepalive_expiry=600
         )
         
         # Minimal headers for faster requests
@@ -536,118 +634,109 @@ class UrlChecker(BaseModule):
             'Accept-Encoding': 'gzip',  # Enable compression
         }
         
-        client_params = {
+        # Parâmetros por requisição: a sessão compartilhada é identificada
+        # apenas pela configuração de conexão
+        # Para checagem de status um 3xx já é resposta final: redirecionamentos
+        # só são seguidos (até max_redirects) quando a URL final será exibida,
+        # evitando até max_redirects requisições extras por URL
+        follow_redirects = bool(
+            self.options.get('show_final_url', False) and self.options.get('follow_redirects', True)
+        )
+        request_kwargs = {
             'timeout': timeout,
-            'follow_redirects': self.options.get('follow_redirects', True),
+            'follow_redirects': follow_redirects,
             'headers': headers,
+        }
+        run_opts['request_kwargs'] = request_kwargs
+        
+        client_params = {
             'limits': limits,
             'verify': self.options.get('verify_ssl', False),
+            # Negociado via ALPN: servidores sem HTTP/2 continuam em HTTP/1.1
+            'http2': bool(self.options.get('http2', True)) and HTTP2_AVAILABLE,
         }
+        if follow_redirects:
+            client_params['max_redirects'] = self.options.get('max_redirects', 3)
         
         # Add proxy if configured
         proxy = self.options.get('proxy')
         if proxy:
-            client_params['proxies'] = proxy
+            client_params['proxy'] = proxy
         
         # Get HTTP methods to try
-        methods = [m.strip().upper() for m in self.options.get('methods', 'GET').split(',')]
+        methods = [m.strip().upper() for m in self.options.get('methods', 'GET').split(',') if m.strip()]
         if not methods:
             methods = ['GET']
         
         try:
-            async with httpx.AsyncClient(**client_params) as session:
+            # Sessão persistente do processo: pool de conexões, keep-alive e
+            # sessões TLS são reaproveitados entre execuções de run()
+            session = get_shared_runtime()[1].get_session(**client_params)
+            
+            # Sonda única usada tanto pelo aiometer quanto pelo fallback manual.
+            # Caso comum (um só método, ex: HEAD): chama _check_url_status
+            # direto, sem o laço de métodos e sem um nível extra de await
+            if len(methods) == 1:
+                method = methods[0]
                 
-                async def check_url_with_methods(url: str) -> Tuple[str, int, str]:
-                    """Check URL with multiple methods if needed."""
-                    if self.interrupted:
-                        return url, -1, url
-                    
-                    # Try each method until we get a valid response
-                    for method in methods:
-                        if self.interrupted:
-                            return url, -1, url
-                        
-                        url_result, status_code, final_url = await self._check_url_status(session, url, method)
-                        
-                        # If we get a successful response, return it
-                        if status_code > 0:
-                            return url_result, status_code, final_url
-                    
-                    # If all methods failed, return the last result
-                    return url, status_code, final_url
+                def probe(url: str) -> Awaitable[Tuple[str, int, str]]:
+                    return self._check_url_status(
+                        session, url, method, retry_attempts, retry_delay, debug, request_kwargs
+                    )
+            else:
+                probe = self._build_multi_method_probe(
+                    session, methods, retry_attempts, retry_delay, debug, request_kwargs
+                )
+            
+            # Use aiometer.amap if available, otherwise fall back to manual processing
+            if aiometer is not None:
+                # Configure aiometer rate limiting
+                max_per_second = run_opts['max_per_second']
+                max_concurrent = run_opts['max_concurrent']
+                include = self._filter_fn
                 
-                # Use aiometer.amap if available, otherwise fall back to manual processing
-                if aiometer is not None:
-                    # Configure aiometer rate limiting
-                    max_per_second = self.options.get('max_per_second', 10)
-                    max_concurrent = self.options.get('max_concurrent', 20)
-                    
-                    if self.options.get('debug'):
-                        self.log_debug(f"Using aiometer with {max_per_second} req/s, {max_concurrent} concurrent")
-                    
-                    try:
-                        # Use aiometer.amap for rate-limited concurrent execution
-                        async with aiometer.amap(
-                            check_url_with_methods,
-                            urls,
-                            max_per_second=max_per_second,
-                            max_at_once=max_concurrent
-                        ) as url_results_async:
-                            # Process results as they come
-                            async for result in url_results_async:
-                                if self.interrupted:
-                                    break
-                                
-                                url, status_code, final_url = result
-                                if self._should_include_status(status_code):
-                                    results[url] = (status_code, final_url)
-                                
-                                self.processed_count += 1
-                            
-                    except asyncio.CancelledError:
-                        if self.options.get('debug'):
-                            self.log_debug("[!] Aiometer execution cancelled")
-                        self.interrupted = True
-                    except Exception as e:
-                        if self.options.get('debug'):
-                            self.log_debug(f"[!] Aiometer execution error: {e}")
-                        # Fall back to manual processing
-                        results = await self._manual_url_processing(session, urls, methods, results)
-                else:
-                    # Fall back to manual processing when aiometer is not available
-                    if self.options.get('debug'):
-                        self.log_debug("Aiometer not available, using manual processing")
-                    results = await self._manual_url_processing(session, urls, methods, results)
+                if debug:
+                    self.log_debug(f"Using aiometer with {max_per_second} req/s, {max_concurrent} concurrent")
+                
+                try:
+                    # Use aiometer.amap for rate-limited concurrent execution
+                    async with aiometer.amap(
+                        probe,
+                        urls,
+                        max_per_second=max_per_second,
+                        max_at_once=max_concurrent
+                    ) as url_results_async:
+                        # Process results as they come
+                        async for result in url_results_async:
+                            url, status_code, final_url = result
+                            if include(status_code):
+                                self._record_result(results, url, status_code, final_url, run_opts)
+                        
+                except asyncio.CancelledError:
+                    if debug:
+                        self.log_debug("[!] Aiometer execution cancelled")
+                    self.interrupted = True
+                except Exception as e:
+                    if debug:
+                        self.log_debug(f"[!] Aiometer execution error: {e}")
+                    # Fall back to manual processing
+                    results = await self._manual_url_processing(probe, urls, results, run_opts)
+            else:
+                # Fall back to manual processing when aiometer is not available
+                if debug:
+                    self.log_debug("Aiometer not available, using manual processing")
+                results = await self._manual_url_processing(probe, urls, results, run_opts)
         
         except asyncio.CancelledError:
-            if self.options.get('debug'):
+            if debug:
                 self.log_debug("[!] URL checking async cancelled")
             self.interrupted = True
         except Exception as e:
-            if self.options.get('debug'):
+            if debug:
                 self.log_debug(f"Erro na verificação assíncrona: {e}")
         
         return results
     
-    def _setup_signal_handlers(self):
-        """
-        Configura manipuladores de sinal para interrupção graciosa.
-        """
-        try:
-            def signal_handler(signum, frame):
-                self.interrupted = True
-                if self.options.get('debug'):
-                    self.log_debug("Verificação interrompida pelo usuário")
-                # Raise KeyboardInterrupt to properly handle the signal
-                raise KeyboardInterrupt("URL checking interrupted by user")
-            
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
-        except ValueError:
-            # Signal handlers not available (not main thread)
-            if self.options.get('debug'):
-                self.log_debug("Signal handlers não disponíveis (não é thread principal)")
-    
     def run(self):
         """
         Executa a verificação de URLs.
@@ -656,9 +745,8 @@ class UrlChecker(BaseModule):
             # Clear previous results
             self._result[self._get_cls_name()].clear()
             self.url_results.clear()
-            self.failed_urls.clear()
-            self.processed_count = 0
             self.interrupted = False
+            self._refresh_filters()
             
             # Get input data
             # Don't use Format.clear_value as it removes newlines which we need
@@ -678,14 +766,12 @@ class UrlChecker(BaseModule):
             if self.options.get('debug'):
                 self.log_debug(f"Verificando {len(urls)} URLs...")
             
-            # Setup signal handling
-            self._setup_signal_handlers()
-            
             # Run async URL checking with proper interrupt handling
             try:
                 # Use asyncio.run with proper KeyboardInterrupt handling
                 try:
-                    results = asyncio.run(self._check_urls_async(urls))
+                    # Executa no event loop compartilhado, onde vive a sessão httpx
+                    results = run_in_shared_loop(self._check_urls_async(urls))
                 except KeyboardInterrupt:
                     self.interrupted = True
                     if self.options.get('debug'):
@@ -701,21 +787,14 @@ class UrlChecker(BaseModule):
                     self.log_debug(f"Erro durante verificação: {e}")
                 results = self.url_results
             
-            # Format results
+            # Sem sort_output as linhas já foram emitidas conforme chegaram
             if results:
-                result_lines = []
-                
-                # Sort by URL for consistent output
-                for url in sorted(results.keys()):
-                    status_code, final_url = results[url]
-                    
-                    # Format output based on show_final_url option
-                    if self.options.get('show_final_url', True) and final_url != url:
-                        result_lines.append(f"{url} -> {final_url}; {status_code}")
-                    else:
-                        result_lines.append(f"{url}; {status_code}")
-                
-                self.set_result("\n".join(result_lines))
+                if self.options.get('sort_output', False):
+                    show_final_url = self.options.get('show_final_url', False)
+                    self.set_result([
+                        self._format_result_line(url, status_code, final_url, show_final_url)
+                        for url, (status_code, final_url) in sorted(results.items())
+                    ])
                 
                 if self.options.get('debug'):
                     status = "interrompida" if self.interrupted else "concluída"
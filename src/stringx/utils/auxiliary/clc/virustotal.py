@@ -21,9 +21,203 @@ de risco durante investigações OSINT.
 import re
 import json
 import asyncio
+import ipaddress
+from base64 import urlsafe_b64encode
+from datetime import datetime
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+# Bibliotecas de terceiros
+import httpx
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from stringx.core.basemodule import BaseModule
-from stringx.core.http_async import HTTPClient
+from stringx.core.http_async import HTTP2_AVAILABLE, await_in_shared_loop, get_shared_runtime, run_in_shared_loop
+from stringx.core.ttl_cache import ttl_cache
+
+# Decodificador JSON: orjson quando disponível, senão a biblioteca padrão.
+# Ambos aceitam bytes, dispensando a decodificação de response.text
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Pool da sessão compartilhada: todas as consultas vão ao mesmo host, então
+# as conexões TCP/TLS abertas ficam vivas e são reaproveitadas entre alvos.
+# Com HTTP/2 as consultas simultâneas são multiplexadas em poucas conexões
+_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=60)
+
+# Cabeçalho do bloco de estatísticas, comum a todos os tipos de consulta
+_STATS_HEADER = "🛡️ Análise:"
+
+# Endpoint base da API v3
+_VT_API = 'https://www.virustotal.com/api/v3'
+
+# Cabeçalhos fixos das requisições; apenas a API key varia por consulta.
+# A sessão é compartilhada com outros módulos, então os cabeçalhos vão em
+# cada requisição e não como padrão do cliente
+_VT_BASE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json',
+}
+
+# Consultas simultâneas por execução (respeita o rate limit da API)
+_MAX_CONCURRENT = 16
+
+# Hashes (MD5, SHA1, SHA256) são reconhecidos pelo tamanho e removendo os
+# dígitos hexadecimais com str.translate: sobra string vazia só se for hex
+_HASH_LENGTHS = frozenset((32, 40, 64))
+_HEX_DELETE = str.maketrans('', '', '0123456789abcdefABCDEF')
+
+# Padrão de detecção de IPv4, compilado uma única vez
+_RE_IPV4 = re.compile(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$')
+
+def _stats_lines(stats: dict) -> List[str]:
+    """Formata as linhas de last_analysis_stats."""
+    return [
+        _STATS_HEADER,
+        f"  • Maliciosos: {stats.get('malicious', 0)}",
+        f"  • Suspeitos: {stats.get('suspicious', 0)}",
+        f"  • Limpos: {stats.get('harmless', 0)}",
+        f"  • Não detectados: {stats.get('undetected', 0)}",
+    ]
+
+
+# Campos de data.attributes usados no relatório de arquivos
+_FILE_FIELDS = ('last_analysis_stats', 'type_description', 'size', 'names')
+
+
+def _compact_file_attributes(attributes: dict) -> dict:
+    """
+    Reduz os atributos de um arquivo aos campos exibidos no relatório.
+    
+    last_analysis_results (dezenas de mecanismos) fica só com as três
+    primeiras detecções maliciosas, mantendo o cache em disco pequeno.
+    """
+    compact = {field: attributes[field] for field in _FILE_FIELDS if field in attributes}
+    detections = {}
+    for engine, result_data in attributes.get('last_analysis_results', {}).items():
+        if result_data.get('category') == 'malicious':
+            detections[engine] = result_data
+            if len(detections) == 3:
+                break
+    compact['last_analysis_results'] = detections
+    return compact
+
+
+def _render_url(attributes: dict) -> List[str]:
+    """Linhas específicas do relatório de URL."""
+    lines = []
+    # Categorias
+    categories = attributes.get('categories', {})
+    if categories:
+        lines.append(f"Categorias: {', '.join(islice(categories.values(), 3))}")
+    
+    # Redirect chain
+    redirects = attributes.get('redirection_chain', [])
+    if redirects and len(redirects) > 1:
+        lines.append(f"Redirecionamentos: {len(redirects)}")
+    return lines
+
+
+def _render_ip(attributes: dict) -> List[str]:
+    """Linhas específicas do relatório de IP."""
+    # Geolocalização
+    country = attributes.get('country', 'N/A')
+    asn = attributes.get('asn', 'N/A')
+    as_owner = attributes.get('as_owner', 'N/A')
+    return [f"🌍 País: {country}", f"🏢 ASN: {asn} ({as_owner})"]
+
+
+def _render_domain(attributes: dict) -> List[str]:
+    """Linhas específicas do relatório de domínio."""
+    lines = []
+    # Informações de DNS
+    records = attributes.get('last_dns_records', [])
+    if records:
+        a_records = list(islice((r['value'] for r in records if r['type'] == 'A'), 3))
+        if a_records:
+            lines.append(f"📍 IPs: {', '.join(a_records)}")
+    
+    # Categorias
+    categories = attributes.get('categories', {})
+    if categories:
+        lines.append(f"Categorias: {', '.join(islice(categories.values(), 3))}")
+    
+    # Whois
+    whois_date = attributes.get('whois_date')
+    if whois_date:
+        date_obj = datetime.fromtimestamp(whois_date)
+        lines.append(f"📅 Whois: {date_obj.year:04d}-{date_obj.month:02d}-{date_obj.day:02d}")
+    return lines
+
+
+def _render_file(attributes: dict) -> List[str]:
+    """Linhas específicas do relatório de arquivo."""
+    # Informações do arquivo
+    file_type = attributes.get('type_description', 'N/A')
+    size = attributes.get('size', 0)
+    names = attributes.get('names', [])
+    
+    lines = [f"📄 Tipo: {file_type}", f"💾 Tamanho: {size} bytes"]
+    if names:
+        lines.append(f"📛 Nome: {names[0]}")
+    
+    # Top detecções
+    engines = attributes.get('last_analysis_results', {})
+    detections = []
+    for engine, result_data in engines.items():
+        if result_data.get('category') == 'malicious':
+            malware_name = result_data.get('result', 'Malware')
+            detections.append(f"{engine}: {malware_name}")
+            # Só as três primeiras são exibidas
+            if len(detections) == 3:
+                break
+    
+    if detections:
+        lines.append(f"Detecções: {'; '.join(detections)}")
+    return lines
+
+
+# Tipos de recurso: tipo -> (caminho na API, título, rótulo, mensagem de
+# 404, contexto de erro, função que gera as linhas específicas do tipo)
+_RESOURCES = {
+    'url': ('urls', '🔗 URL', 'URL', 'Não analisada ainda', 'URL', _render_url),
+    'ip': ('ip_addresses', '🌐 IP', 'IP', 'Nenhuma informação disponível', 'IP', _render_ip),
+    'domain': ('domains', '🌐 Domínio', 'Domínio', 'Nenhuma informação disponível', 'domínio', _render_domain),
+    'file': ('files', '📁 Hash', 'Hash', 'Arquivo não encontrado', 'arquivo', _render_file),
+}
+
+
+def _normalize_target(data: str, resource_type: str) -> str:
+    """
+    Forma canônica de um alvo, usada para não repetir consultas equivalentes.
+    
+    URLs têm esquema e host em minúsculas e perdem o fragmento; domínios
+    perdem o ponto final e são convertidos para IDNA; IPs são compactados e
+    hashes ficam em minúsculas. Entradas que não convertem ficam como estão.
+    """
+    try:
+        if resource_type == 'url':
+            parts = urlsplit(data)
+            return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+        if resource_type == 'domain':
+            return data.strip('.').lower().encode('idna').decode('ascii')
+        if resource_type == 'ip':
+            return ipaddress.ip_address(data).compressed
+        if resource_type == 'file':
+            return data.lower()
+    except (ValueError, UnicodeError):
+        pass
+    return data
+
+
+def _vt_url_id(url: str) -> str:
+    """Identificador de URL da API v3: base64 urlsafe sem padding."""
+    # rstrip nos bytes evita criar uma str intermediária com o padding
+    return urlsafe_b64encode(url.encode()).rstrip(b'=').decode('ascii')
+
 
 class VirusTotalCollector(BaseModule):
     """
@@ -39,8 +233,8 @@ class VirusTotalCollector(BaseModule):
         Inicializa o módulo coletor VirusTotal.
         """
         super().__init__()
-        # Instância do cliente HTTP assíncrono
-        self.request = HTTPClient()
+        # Nome da classe (chave do buffer de resultados), resolvido uma vez
+        self._cls_name = self._get_cls_name()
         # Metadados do módulo
         self.meta = {
             'name': 'VirusTotal Collector',
@@ -53,74 +247,151 @@ class VirusTotalCollector(BaseModule):
         }
         # Opções configuráveis do módulo
         self.options = {
-            'data': str(),  # URL, IP, domain ou hash
+            'data': str(),  # URL, IP, domain ou hash (ou lista deles)
             'api_key': self.setting.STRX_VIRUSTOTAL_APIKEY,  # API key do VirusTotal
             'resource_type': 'auto',  # auto, url, ip, domain, file
             'include_details': True,
+            'cache': True,           # Cache em disco das consultas (desligar para reputação atualizada)
+            'cache_ttl': 3600,       # Validade do cache em segundos
             'retry': 0,              # Número de tentativas de requisição
             'retry_delay': None,        # Atraso entre tentativas de requisição
         }
     
+    @property
+    def request(self):
+        """
+        Cliente HTTP persistente compartilhado pelo processo.
+        
+        Não é armazenado na instância para que o módulo continue podendo ser
+        copiado (deepcopy/pickle) pelo carregador de módulos.
+        """
+        return get_shared_runtime()[1]
+    
     def run(self):
         """
         Executa consulta na API do VirusTotal.
+        
+        Aceita um único alvo ou uma lista de alvos em 'data'; listas são
+        consultadas concorrentemente em uma única execução no event loop
+        compartilhado.
         """
         try:
-           
-            
-            data = self.options.get('data', '').strip()
+            data = self.options.get('data', '')
             api_key = self.options.get('api_key', '')
             resource_type = self.options.get('resource_type', 'auto')
             
-            if not data:
+            targets = self._parse_targets(data)
+            if not targets:
                 return
             
             # Limpar resultados anteriores para evitar acúmulo
-            self._result[self._get_cls_name()].clear()
+            self._result[self._cls_name].clear()
 
             if not api_key:
                 self.log_debug("[x] Erro: API key do VirusTotal é obrigatória")
                 return
             
-            # Detectar tipo automaticamente se necessário
-            if resource_type == 'auto':
-                resource_type = self._detect_resource_type(data)
-            
-            # Executar consulta baseada no tipo
-            if resource_type == 'url':
-                result = self._query_url(data, api_key)
-            elif resource_type == 'ip':
-                result = self._query_ip(data, api_key)
-            elif resource_type == 'domain':
-                result = self._query_domain(data, api_key)
-            elif resource_type == 'file':
-                result = self._query_file(data, api_key)
-            else:
-                self.log_debug(f"[x] Erro: Tipo de recurso não suportado: {resource_type}")
-                return
-            
-            if result:
-                self.set_result(result)
+            results = run_in_shared_loop(self._run_many(targets, api_key, resource_type))
+            self.set_result(results)
                 
         except Exception as e:
             self.handle_error(e, "Erro VirusTotal")
     
+    async def query_async(self, data, api_key: Optional[str] = None,
+                          resource_type: Optional[str] = None) -> List[str]:
+        """
+        Ponto de entrada assíncrono para chamadores que já estão em um event loop.
+        
+        Equivale a run(), mas pode ser aguardado de qualquer loop sem
+        bloqueá-lo e retorna os resultados em vez de gravá-los no módulo.
+        
+        Args:
+            data: Alvo (URL, IP, domínio ou hash) ou lista de alvos
+            api_key (str): API key (padrão: opção 'api_key')
+            resource_type (str): Tipo de recurso (padrão: opção 'resource_type')
+            
+        Returns:
+            List[str]: Resultados formatados, na ordem da entrada
+        """
+        api_key = api_key or self.options.get('api_key', '')
+        resource_type = resource_type or self.options.get('resource_type', 'auto')
+        targets = self._parse_targets(data)
+        if not targets or not api_key:
+            return []
+        results = await await_in_shared_loop(self._run_many(targets, api_key, resource_type))
+        return [result for result in results if result]
+    
+    @staticmethod
+    def _parse_targets(data) -> List[str]:
+        """Converte 'data' (string ou coleção) em uma lista de alvos não vazios."""
+        if isinstance(data, (list, tuple, set)):
+            return [str(item).strip() for item in data if item and str(item).strip()]
+        return [data.strip()] if data and data.strip() else []
+    
+    async def _run_many(self, targets: List[str], api_key: str, resource_type: str) -> List[str]:
+        """
+        Consulta vários alvos concorrentemente, na ordem da entrada.
+        
+        Os alvos são normalizados e deduplicados antes do envio, então
+        variações do mesmo recurso geram uma única consulta.
+        
+        Args:
+            targets (List[str]): URLs, IPs, domínios ou hashes
+            api_key (str): API key do VirusTotal
+            resource_type (str): Tipo de recurso ou 'auto'
+            
+        Returns:
+            List[str]: Resultados formatados (vazios para alvos sem consulta)
+        """
+        # dict como conjunto ordenado de (tipo, alvo normalizado)
+        jobs: Dict[Tuple[str, str], None] = {}
+        for target in targets:
+            target_type = self._detect_resource_type(target) if resource_type == 'auto' else resource_type
+            jobs[(target_type, _normalize_target(target, target_type))] = None
+        
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT)
+        
+        async def bounded(target: str, target_type: str) -> Optional[str]:
+            async with semaphore:
+                return await self._dispatch(target, api_key, target_type)
+        
+        return await asyncio.gather(*(bounded(target, target_type) for target_type, target in jobs))
+    
+    async def _dispatch(self, data: str, api_key: str, resource_type: str) -> Optional[str]:
+        """
+        Executa a consulta adequada ao tipo de recurso do alvo.
+        
+        Args:
+            data (str): URL, IP, domínio ou hash
+            api_key (str): API key do VirusTotal
+            resource_type (str): Tipo de recurso ou 'auto'
+            
+        Returns:
+            Optional[str]: Resultado formatado ou None se o tipo não for suportado
+        """
+        # Detectar tipo automaticamente se necessário
+        if resource_type == 'auto':
+            resource_type = self._detect_resource_type(data)
+        
+        # Executar consulta baseada no tipo
+        if resource_type in _RESOURCES:
+            return await self._query_async(resource_type, data, api_key)
+        
+        self.log_debug(f"[x] Erro: Tipo de recurso não suportado: {resource_type}")
+        return None
+    
     def _detect_resource_type(self, data: str) -> str:
         """Detecta automaticamente o tipo de recurso."""
-        # Hash (MD5, SHA1, SHA256)
-        if re.match(r'^[a-fA-F0-9]{32}$', data):
-            return 'file'  # MD5
-        elif re.match(r'^[a-fA-F0-9]{40}$', data):
-            return 'file'  # SHA1
-        elif re.match(r'^[a-fA-F0-9]{64}$', data):
-            return 'file'  # SHA256
-        
-        # URL
-        elif data.startswith(('http://', 'https://')):
+        # URL (teste barato de prefixo antes das regex)
+        if data.startswith(('http://', 'https://')):
             return 'url'
         
+        # Hash (MD5, SHA1, SHA256)
+        elif len(data) in _HASH_LENGTHS and not data.translate(_HEX_DELETE):
+            return 'file'
+        
         # IP
-        elif re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$', data):
+        elif _RE_IPV4.match(data):
             return 'ip'
         
         # Domain
@@ -129,239 +400,75 @@ class VirusTotalCollector(BaseModule):
         
         return 'unknown'
     
-    async def _query_url_async(self, url: str, api_key: str) -> str:
-        """Consulta análise de URL."""
-        try:
-            import base64
-            
-            # Codificar URL em base64 sem padding
-            url_id = base64.urlsafe_b64encode(url.encode()).decode().rstrip('=')
-            
-            api_url = f"https://www.virustotal.com/api/v3/urls/{url_id}"
-            
-            kwargs = {
-                'headers': {
-                    'x-apikey': api_key,
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'application/json',
-                },
-                'timeout': 15,
-            }
-            
-            response = await self.request.send_request([api_url], **kwargs)
-            response = response[0]
-            
-            if response.status_code == 200:
-                data = json.loads(response.text)
-                
-                attributes = data.get('data', {}).get('attributes', {})
-                stats = attributes.get('last_analysis_stats', {})
-                
-                result = f"🔗 URL: {url}\n"
-                result += f"🛡️ Análise:\n"
-                result += f"  • Maliciosos: {stats.get('malicious', 0)}\n"
-                result += f"  • Suspeitos: {stats.get('suspicious', 0)}\n"
-                result += f"  • Limpos: {stats.get('harmless', 0)}\n"
-                result += f"  • Não detectados: {stats.get('undetected', 0)}\n"
-                
-                # Categorias
-                categories = attributes.get('categories', {})
-                if categories:
-                    cats = list(categories.values())[:3]
-                    result += f"Categorias: {', '.join(cats)}\n"
-                
-                # Redirect chain
-                redirects = attributes.get('redirection_chain', [])
-                if redirects and len(redirects) > 1:
-                    result += f"Redirecionamentos: {len(redirects)}\n"
-                
-                return result
-            elif response.status_code == 404:
-                return f"URL {url}: Não analisada ainda"
-            else:
-                return f"Erro HTTP {response.status_code}"
-                
-        except Exception as e:
-            return self.handle_error(e, "Erro na consulta de URL VirusTotal")
-            
-    def _query_url(self, url: str, api_key: str) -> str:
-        """Consulta análise de URL (wrapper para método assíncrono)."""
-        return asyncio.run(self._query_url_async(url, api_key))
-    
-    async def _query_ip_async(self, ip: str, api_key: str) -> str:
-        """Consulta análise de IP."""
-        try:
-            api_url = f"https://www.virustotal.com/api/v3/ip_addresses/{ip}"
-            
-            kwargs = {
-                'headers': {
-                    'x-apikey': api_key,
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'application/json',
-                },
-                'timeout': 15,
-            }
-            
-            response = await self.request.send_request([api_url], **kwargs)
-            response = response[0]
-            
-            if response.status_code == 200:
-                data = json.loads(response.text)
-                
-                attributes = data.get('data', {}).get('attributes', {})
-                stats = attributes.get('last_analysis_stats', {})
-                
-                result = f"🌐 IP: {ip}\n"
-                result += f"🛡️ Análise:\n"
-                result += f"  • Maliciosos: {stats.get('malicious', 0)}\n"
-                result += f"  • Suspeitos: {stats.get('suspicious', 0)}\n"
-                result += f"  • Limpos: {stats.get('harmless', 0)}\n"
-                result += f"  • Não detectados: {stats.get('undetected', 0)}\n"
-                
-                # Geolocalização
-                country = attributes.get('country', 'N/A')
-                asn = attributes.get('asn', 'N/A')
-                as_owner = attributes.get('as_owner', 'N/A')
-                
-                result += f"🌍 País: {country}\n"
-                result += f"🏢 ASN: {asn} ({as_owner})\n"
-                
-                return result
-            elif response.status_code == 404:
-                return f"IP {ip}: Nenhuma informação disponível"
-            else:
-                return f"Erro HTTP {response.status_code}"
-                
-        except Exception as e:
-            return self.handle_error(e, "Erro na consulta de IP VirusTotal")
+    @ttl_cache(ttl=3600, namespace='virustotal')
+    async def _fetch_attributes(self, api_url: str, api_key: str, compact: bool = False) -> Optional[dict]:
+        """
+        Obtém data.attributes de um recurso da API do VirusTotal.
+        
+        Respostas com sucesso ficam em cache em disco por uma hora (opções
+        'cache' e 'cache_ttl'), evitando repetir consultas a alvos já vistos.
+        Recursos inexistentes (404) retornam None e os demais status levantam
+        httpx.HTTPStatusError; nenhum dos dois é gravado no cache.
+        
+        Args:
+            api_url (str): Endpoint do recurso na API v3
+            api_key (str): API key do VirusTotal
+            compact (bool): Manter apenas os campos do relatório de arquivos
             
-    def _query_ip(self, ip: str, api_key: str) -> str:
-        """Consulta análise de IP (wrapper para método assíncrono)."""
-        return asyncio.run(self._query_ip_async(ip, api_key))
+        Returns:
+            Optional[dict]: Atributos do recurso ou None se não encontrado
+        """
+        session = self.request.get_session(limits=_LIMITS, http2=HTTP2_AVAILABLE)
+        headers = {**_VT_BASE_HEADERS, 'x-apikey': api_key}
+        
+        # Streaming: o corpo só é baixado quando a resposta será usada
+        async with session.stream('GET', api_url, headers=headers, timeout=15) as response:
+            if not response.is_success:
+                # Em HTTP/2 fechar o stream descarta o corpo sem afetar a
+                # conexão; em HTTP/1.1 o corpo (pequeno) é lido para que a
+                # conexão volte ao pool em vez de ser fechada
+                if response.http_version != 'HTTP/2':
+                    await response.aread()
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+            content = await response.aread()
+        
+        data = _json_loads(content)
+        attributes = data.get('data', {}).get('attributes', {})
+        return _compact_file_attributes(attributes) if compact else attributes
     
-    async def _query_domain_async(self, domain: str, api_key: str) -> str:
-        """Consulta análise de domínio."""
-        try:
-            api_url = f"https://www.virustotal.com/api/v3/domains/{domain}"
-            
-            kwargs = {
-                'headers': {
-                    'x-apikey': api_key,
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'application/json',
-                },
-                'timeout': 15,
-            }
-            
-            response = await self.request.send_request([api_url], **kwargs)
-            response = response[0]
-            
-            if response.status_code == 200:
-                data = json.loads(response.text)
-                
-                attributes = data.get('data', {}).get('attributes', {})
-                stats = attributes.get('last_analysis_stats', {})
-                
-                result = f"🌐 Domínio: {domain}\n"
-                result += f"🛡️ Análise:\n"
-                result += f"  • Maliciosos: {stats.get('malicious', 0)}\n"
-                result += f"  • Suspeitos: {stats.get('suspicious', 0)}\n"
-                result += f"  • Limpos: {stats.get('harmless', 0)}\n"
-                result += f"  • Não detectados: {stats.get('undetected', 0)}\n"
-                
-                # Informações de DNS
-                records = attributes.get('last_dns_records', [])
-                if records:
-                    a_records = [r['value'] for r in records if r['type'] == 'A'][:3]
-                    if a_records:
-                        result += f"📍 IPs: {', '.join(a_records)}\n"
-                
-                # Categorias
-                categories = attributes.get('categories', {})
-                if categories:
-                    cats = list(categories.values())[:3]
-                    result += f"Categorias: {', '.join(cats)}\n"
-                
-                # Whois
-                whois_date = attributes.get('whois_date')
-                if whois_date:
-                    import datetime
-                    date_obj = datetime.datetime.fromtimestamp(whois_date)
-                    result += f"📅 Whois: {date_obj.strftime('%Y-%m-%d')}\n"
-                
-                return result
-            elif response.status_code == 404:
-                return f"Domínio {domain}: Nenhuma informação disponível"
-            else:
-                return f"Erro HTTP {response.status_code}"
-                
-        except Exception as e:
-            return self.handle_error(e, "Erro na consulta de domínio VirusTotal")
+    async def _query_async(self, resource_type: str, data: str, api_key: str) -> str:
+        """
+        Consulta um recurso na API e formata o relatório.
+        
+        Args:
+            resource_type (str): Tipo do recurso (chave de _RESOURCES)
+            data (str): URL, IP, domínio ou hash
+            api_key (str): API key do VirusTotal
             
-    def _query_domain(self, domain: str, api_key: str) -> str:
-        """Consulta análise de domínio (wrapper para método assíncrono)."""
-        return asyncio.run(self._query_domain_async(domain, api_key))
-    
-    async def _query_file_async(self, file_hash: str, api_key: str) -> str:
-        """Consulta análise de arquivo por hash."""
+        Returns:
+            str: Relatório formatado ou mensagem de erro/ausência
+        """
+        path, title, label, not_found, context, render = _RESOURCES[resource_type]
+        resource_id = _vt_url_id(data) if resource_type == 'url' else data
         try:
-            api_url = f"https://www.virustotal.com/api/v3/files/{file_hash}"
-            
-            kwargs = {
-                'headers': {
-                    'x-apikey': api_key,
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'application/json',
-                },
-                'timeout': 15,
-            }
+            attributes = await self._fetch_attributes(
+                f"{_VT_API}/{path}/{resource_id}", api_key, compact=resource_type == 'file'
+            )
+            if attributes is None:
+                return f"{label} {data}: {not_found}"
             
-            response = await self.request.send_request([api_url], **kwargs)
-            response = response[0]
-            
-            if response.status_code == 200:
-                data = json.loads(response.text)
-                
-                attributes = data.get('data', {}).get('attributes', {})
-                stats = attributes.get('last_analysis_stats', {})
-                
-                result = f"📁 Hash: {file_hash}\n"
-                result += f"🛡️ Análise:\n"
-                result += f"  • Maliciosos: {stats.get('malicious', 0)}\n"
-                result += f"  • Suspeitos: {stats.get('suspicious', 0)}\n"
-                result += f"  • Limpos: {stats.get('harmless', 0)}\n"
-                result += f"  • Não detectados: {stats.get('undetected', 0)}\n"
-                
-                # Informações do arquivo
-                file_type = attributes.get('type_description', 'N/A')
-                size = attributes.get('size', 0)
-                names = attributes.get('names', [])
-                
-                result += f"📄 Tipo: {file_type}\n"
-                result += f"💾 Tamanho: {size} bytes\n"
-                if names:
-                    result += f"📛 Nome: {names[0]}\n"
-                
-                # Top detecções
-                engines = attributes.get('last_analysis_results', {})
-                detections = []
-                for engine, result_data in engines.items():
-                    if result_data.get('category') == 'malicious':
-                        malware_name = result_data.get('result', 'Malware')
-                        detections.append(f"{engine}: {malware_name}")
-                
-                if detections:
-                    result += f"Detecções: {'; '.join(detections[:3])}\n"
-                
-                return result
-            elif response.status_code == 404:
-                return f"Hash {file_hash}: Arquivo não encontrado"
-            else:
-                return f"Erro HTTP {response.status_code}"
+            lines = [f"{title}: {data}"]
+            lines.extend(_stats_lines(attributes.get('last_analysis_stats', {})))
+            lines.extend(render(attributes))
+            return "\n".join(lines) + "\n"
                 
+        except httpx.HTTPStatusError as e:
+            return f"Erro HTTP {e.response.status_code}"
         except Exception as e:
-            return self.handle_error(e, "Erro na consulta de arquivo VirusTotal")
+            return self.handle_error(e, f"Erro na consulta de {context} VirusTotal")
             
-    def _query_file(self, file_hash: str, api_key: str) -> str:
-        """Consulta análise de arquivo por hash (wrapper para método assíncrono)."""
-        return asyncio.run(self._query_file_async(file_hash, api_key))
\ No newline at end of file
+    def _query(self, resource_type: str, data: str, api_key: str) -> str:
+        """Consulta um recurso (wrapper para método assíncrono)."""
+        return run_in_shared_loop(self._query_async(resource_type, data, api_key))
@@ -21,13 +21,168 @@ Estas informações são valiosas para:
 - Identificar informações de contato para investigações adicionais
 """
 # Bibliotecas padrão
-from typing import Optional, Dict, Any
+import re
+import time
+import asyncio
+import ipaddress
+from typing import Optional, Dict, Any, List, Tuple
 
 # Bibliotecas de terceiros
 import whois
+from whois.parser import WhoisEntry
+try:
+    from whois.exceptions import PywhoisError
+except ImportError:
+    # python-whois < 0.9.6 define a exceção em whois.parser
+    from whois.parser import PywhoisError
 
 # Módulos locais
 from stringx.core.basemodule import BaseModule
+from stringx.core.http_async import run_in_shared_loop
+
+# Consultas WHOIS simultâneas por execução; cada uma abre conexões TCP (ou
+# ocupa uma thread no fallback do python-whois), então o limite evita explosão
+_MAX_CONCURRENT = 32
+
+# Cliente WHOIS assíncrono: a IANA indica o servidor de cada TLD e, em
+# registros "thin" (.com, .net), o registro indica o servidor do registrar
+_IANA_WHOIS = 'whois.iana.org'
+_WHOIS_PORT = 43
+_REFER_RE = re.compile(r'^\s*(?:refer|whois):\s*(\S+)', re.IGNORECASE | re.MULTILINE)
+_REGISTRAR_RE = re.compile(r'^\s*Registrar WHOIS Server:\s*(\S+)', re.IGNORECASE | re.MULTILINE)
+
+# Servidor WHOIS por TLD, aprendido nas referências da IANA
+_TLD_SERVERS: Dict[str, str] = {}
+
+# Campos exibidos no log de debug: (atributo, rótulo, itens exibidos de uma
+# lista ou None para só o primeiro, rótulo do excedente ou None)
+_SUMMARY_FIELDS = (
+    ('domain_name', 'Nome de domínio', None, None),
+    ('registrar', 'Registrar', None, None),
+    ('creation_date', 'Data de criação', None, None),
+    ('expiration_date', 'Data de expiração', None, None),
+    ('name_servers', 'Servidores de nome', 3, 'servidores'),
+    ('status', 'Status', 2, None),
+)
+
+# Cache em memória do processo: domínio normalizado -> (expiração, resultado).
+# Os objetos do python-whois contêm datetimes e não são serializáveis em
+# JSON, por isso não usam o ttl_cache em disco.
+_WHOIS_CACHE: Dict[str, Tuple[float, Any]] = {}
+_WHOIS_CACHE_SIZE = 1024
+
+
+def _normalize_domain(domain: str) -> str:
+    """
+    Forma canônica do domínio: registrável, minúsculas, sem ponto final e em IDNA.
+    
+    Como o whois.whois, reduz subdomínios e URLs ao domínio registrável
+    (extract_domain: 'www.example.co.uk' -> 'example.co.uk'), que é o que os
+    registros respondem. IPs são mantidos. Domínios que não convertem para
+    IDNA ficam apenas em minúsculas.
+    """
+    domain = domain.strip().strip('.').lower()
+    if not domain:
+        return domain
+    try:
+        ipaddress.ip_address(domain)
+        return domain
+    except ValueError:
+        pass
+    try:
+        domain = whois.extract_domain(domain) or domain
+    except (OSError, UnicodeError, ValueError):
+        pass
+    try:
+        return domain.encode('idna').decode('ascii')
+    except UnicodeError:
+        return domain
+
+
+def _format_query(server: str, domain: str) -> str:
+    """
+    Aplica a sintaxe de consulta própria de alguns servidores WHOIS.
+    
+    Espelha o NICClient do python-whois: DENIC exige as opções de tipo e
+    codificação, o DK Hostmaster só devolve os handles com --show-handles e o
+    JPRS responde em japonês sem o sufixo /e (o parser espera inglês).
+    
+    Args:
+        server (str): Servidor WHOIS
+        domain (str): Domínio consultado
+        
+    Returns:
+        str: Texto da consulta
+    """
+    if server == whois.NICClient.DENICHOST:
+        return f"-T dn,ace -C UTF-8 {domain}"
+    if server == whois.NICClient.DK_HOST:
+        return f" --show-handles {domain}"
+    if server.endswith('.jp'):
+        return f"{domain}/e"
+    return domain
+
+
+async def _whois_query(server: str, query: str, timeout: float) -> str:
+    """
+    Envia uma consulta WHOIS (RFC 3912) e lê a resposta até o servidor fechar.
+    
+    Args:
+        server (str): Servidor WHOIS
+        query (str): Texto da consulta (domínio ou TLD)
+        timeout (float): Tempo máximo para conexão e leitura
+        
+    Returns:
+        str: Resposta do servidor
+    """
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(server, _WHOIS_PORT), timeout)
+    try:
+        writer.write(f"{query}\r\n".encode('utf-8'))
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+    return data.decode('utf-8', errors='replace')
+
+
+async def _whois_text(domain: str, timeout: float) -> str:
+    """
+    Obtém o texto WHOIS de um domínio seguindo as referências de servidor.
+    
+    Args:
+        domain (str): Domínio normalizado (IDNA)
+        timeout (float): Tempo máximo por conexão
+        
+    Returns:
+        str: Resposta do registro, seguida da do registrar quando houver
+        
+    Raises:
+        LookupError: Se nenhum servidor ou resposta for obtido
+    """
+    tld = domain.rsplit('.', 1)[-1]
+    server = _TLD_SERVERS.get(tld)
+    if server is None:
+        match = _REFER_RE.search(await _whois_query(_IANA_WHOIS, tld, timeout))
+        if not match:
+            raise LookupError(f"Servidor WHOIS não encontrado para .{tld}")
+        server = _TLD_SERVERS[tld] = match.group(1).lower()
+    
+    text = await _whois_query(server, _format_query(server, domain), timeout)
+    if 'with "=xxx"' in text:
+        # Registros "thin" com vários resultados: '=' pede a correspondência exata
+        text = await _whois_query(server, f"={domain}", timeout)
+    if not text.strip():
+        raise LookupError(f"Resposta WHOIS vazia de {server}")
+    
+    match = _REGISTRAR_RE.search(text)
+    if match and match.group(1).lower() != server:
+        registrar = match.group(1).lower()
+        try:
+            text += "\n" + await _whois_query(registrar, _format_query(registrar, domain), timeout)
+        except (OSError, asyncio.TimeoutError):
+            pass  # Mantém a resposta do registro
+    return text
+
 
 class WhoisInfo(BaseModule):
     """
@@ -42,6 +197,8 @@ class WhoisInfo(BaseModule):
         Inicializa o módulo coletor de informações WHOIS.
         """
         super().__init__()
+        # Nome da classe (chave do buffer de resultados), resolvido uma vez
+        self._cls_name = self._get_cls_name()
         self.meta = {
             'name': 'WHOIS Information Collector',
             'author': 'MrCl0wn',
@@ -52,7 +209,11 @@ class WhoisInfo(BaseModule):
             'example': './strx -l domains.txt -st "echo {STRING}" -module "clc:whois" -pm'
         }
         self.options = {
-            'data': str(),            # Domínio alvo para consulta WHOIS            'debug': False,           # Modo de debug para mostrar informações detalhadas
+            'data': str(),            # Domínio alvo para consulta WHOIS (ou lista de domínios)
+            'debug': False,           # Modo de debug para mostrar informações detalhadas
+            'timeout': 10,            # Timeout por conexão WHOIS em segundos
+            'cache': True,            # Reutilizar consultas recentes do mesmo domínio
+            'cache_ttl': 3600,        # Validade do cache em segundos
             'retry': 0,               # Número de tentativas de requisição
             'retry_delay': None,         # Atraso entre tentativas de requisição    
         }
@@ -74,67 +235,132 @@ class WhoisInfo(BaseModule):
         """
         # Only clear results if auto_clear is enabled (default behavior)
         if self._auto_clear_results:
-            self._result[self._get_cls_name()].clear()
+            self._result[self._cls_name].clear()
             
         self.log_debug("[*] Iniciando coleta WHOIS")
         
-        domain = self.options.get("data", "").strip()
-        if not domain:
+        data = self.options.get("data", "")
+        if isinstance(data, (list, tuple, set)):
+            domains = [str(item) for item in data if item]
+        else:
+            domains = [data] if data else []
+        # Normaliza e deduplica antes de consultar: variações do mesmo
+        # domínio (caixa, ponto final, IDN) geram uma única consulta
+        domains = [domain for domain in dict.fromkeys(map(_normalize_domain, domains)) if domain]
+        if not domains:
             self.log_debug("[X] Nenhum domínio fornecido")
             return
         
-        self.log_debug(f"[*] Processando domínio: {domain}")
-        
         try:
-            self.log_debug(f"[*] Consultando WHOIS para: {domain}")
-            
-            whois_info = whois.whois(domain)
-            
-            if whois_info:
-                self.log_debug("[+] Informações WHOIS obtidas com sucesso")
-                
-                # Log de informações importantes encontradas
-                if hasattr(whois_info, 'domain_name') and whois_info.domain_name:
-                    domain_name = whois_info.domain_name
-                    if isinstance(domain_name, list):
-                        domain_name = domain_name[0]
-                    self.log_debug(f"   [*] Nome de domínio: {domain_name}")
-                
-                if hasattr(whois_info, 'registrar') and whois_info.registrar:
-                    self.log_debug(f"   [*] Registrar: {whois_info.registrar}")
-                
-                if hasattr(whois_info, 'creation_date') and whois_info.creation_date:
-                    creation = whois_info.creation_date
-                    if isinstance(creation, list):
-                        creation = creation[0]
-                    self.log_debug(f"   [*] Data de criação: {creation}")
-                
-                if hasattr(whois_info, 'expiration_date') and whois_info.expiration_date:
-                    expiration = whois_info.expiration_date
-                    if isinstance(expiration, list):
-                        expiration = expiration[0]
-                    self.log_debug(f"   [*] Data de expiração: {expiration}")
-                    
-                if hasattr(whois_info, 'name_servers') and whois_info.name_servers:
-                    if isinstance(whois_info.name_servers, list):
-                        ns_list = whois_info.name_servers[:3]
-                        self.log_debug(f"   [*] Servidores de nome: {', '.join(ns_list)}")
-                        if len(whois_info.name_servers) > 3:
-                            self.log_debug(f"        ... e mais {len(whois_info.name_servers) - 3} servidores")
-                    else:
-                        self.log_debug(f"   [*] Servidores de nome: {whois_info.name_servers}")
-                
-                if hasattr(whois_info, 'status') and whois_info.status:
-                    status = whois_info.status
-                    if isinstance(status, list):
-                        status = ', '.join(status[:2])  # Show first 2 statuses
-                    self.log_debug(f"   [*] Status: {status}")
-                
+            # Consultas bloqueantes executadas em threads a partir do event loop
+            # compartilhado, permitindo que vários domínios avancem juntos
+            results = run_in_shared_loop(self._run_many(domains))
+        except Exception as e:
+            self.handle_error(e, "Erro WHOIS")
+            return
+        
+        for domain, whois_info in zip(domains, results):
+            if isinstance(whois_info, Exception):
+                self.handle_error(whois_info, "Erro WHOIS")
+            elif whois_info:
+                self.log_debug(f"[+] Informações WHOIS obtidas com sucesso: {domain}")
+                self._log_summary(whois_info)
                 self.log_debug("[*] Dados WHOIS coletados e formatados")
                 self.set_result(str(whois_info))
             else:
-                self.log_debug("[!] Nenhuma informação WHOIS encontrada")
+                self.log_debug(f"[!] Nenhuma informação WHOIS encontrada: {domain}")
                 self.set_result("Nenhuma informação WHOIS disponível para este domínio")
-                
-        except Exception as e:
-            self.handle_error(e, "Erro WHOIS")
\ No newline at end of file
+    
+    async def _run_many(self, domains: List[str]) -> List[Any]:
+        """
+        Consulta vários domínios concorrentemente, na ordem da entrada.
+        
+        Args:
+            domains (List[str]): Domínios normalizados a consultar
+            
+        Returns:
+            List[Any]: Resultado WHOIS ou a exceção de cada domínio
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT)
+        use_cache = bool(self.options.get('cache', True)) and bool(
+            getattr(self.setting, 'STRX_ENABLE_CACHING', True)
+        )
+        cache_ttl = self.options.get('cache_ttl', 3600) or 3600
+        timeout = self.options.get('timeout', 10) or 10
+        
+        async def lookup(domain: str) -> Any:
+            # O cache só é acessado na thread do event loop compartilhado
+            if use_cache:
+                entry = _WHOIS_CACHE.get(domain)
+                if entry and entry[0] > time.monotonic():
+                    self.log_debug(f"[*] WHOIS em cache para: {domain}")
+                    return entry[1]
+            
+            async with semaphore:
+                self.log_debug(f"[*] Consultando WHOIS para: {domain}")
+                whois_info = await self._whois_async(domain, timeout)
+            
+            if use_cache and whois_info:
+                _WHOIS_CACHE.pop(domain, None)
+                _WHOIS_CACHE[domain] = (time.monotonic() + cache_ttl, whois_info)
+                # Descarta a entrada mais antiga ao exceder o limite
+                if len(_WHOIS_CACHE) > _WHOIS_CACHE_SIZE:
+                    _WHOIS_CACHE.pop(next(iter(_WHOIS_CACHE)))
+            return whois_info
+        
+        return await asyncio.gather(*(lookup(domain) for domain in domains), return_exceptions=True)
+    
+    async def _whois_async(self, domain: str, timeout: float) -> Any:
+        """
+        Consulta WHOIS com o cliente TCP assíncrono.
+        
+        A resposta é interpretada pelo parser do python-whois. IPs, falhas
+        de conexão/referência e respostas que o parser rejeita (por exemplo
+        "No match") usam o python-whois completo em uma thread.
+        
+        Args:
+            domain (str): Domínio normalizado
+            timeout (float): Tempo máximo por conexão
+            
+        Returns:
+            Any: Resultado no formato do python-whois (WhoisEntry)
+        """
+        try:
+            ipaddress.ip_address(domain)
+            return await asyncio.to_thread(whois.whois, domain)
+        except ValueError:
+            pass
+        
+        try:
+            text = await _whois_text(domain, timeout)
+        except (OSError, asyncio.TimeoutError, LookupError) as e:
+            self.log_debug(f"[!] Cliente WHOIS assíncrono falhou para {domain} ({e}); usando python-whois")
+            return await asyncio.to_thread(whois.whois, domain)
+        
+        try:
+            return WhoisEntry.load(domain, text)
+        except PywhoisError as e:
+            self.log_debug(f"[!] Resposta WHOIS não interpretada para {domain} ({e}); usando python-whois")
+            return await asyncio.to_thread(whois.whois, domain)
+    
+    def _log_summary(self, whois_info: Any) -> None:
+        """
+        Registra no log de debug os principais campos do resultado WHOIS.
+        
+        Args:
+            whois_info: Resultado de whois.whois
+        """
+        for attr, label, limit, overflow in _SUMMARY_FIELDS:
+            value = getattr(whois_info, attr, None)
+            if not value:
+                continue
+            extra = 0
+            if isinstance(value, list):
+                if limit is None:
+                    value = value[0]
+                else:
+                    extra = len(value) - limit if overflow else 0
+                    value = ', '.join(map(str, value[:limit]))
+            self.log_debug(f"   [*] {label}: {value}")
+            if extra > 0:
+                self.log_debug(f"        ... e mais {extra} {overflow}")
@@ -20,24 +20,65 @@ utilizando apenas um motor de busca principal como o Google.
 """
 # Bibliotecas padrão
 import re
-import time
 import random
 import asyncio
-from typing import List, Dict, Any, Optional, Set
+import hashlib
+from typing import List, Dict, Any, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse, unquote, quote_plus
 
 # Bibliotecas de terceiros
+import httpx
 from bs4 import BeautifulSoup
 from requests.exceptions import RequestException
 from httpx import ConnectError, ReadTimeout, ConnectTimeout, TimeoutException
+try:
+    from selectolax.lexbor import LexborHTMLParser  # Parser HTML em C, usado quando instalado
+except ImportError:
+    LexborHTMLParser = None
 
 # Módulos locais
 from stringx.core.format import Format
-from stringx.core.http_async import HTTPClient
+from stringx.core.http_async import HTTP2_AVAILABLE, get_shared_runtime, run_in_shared_loop
 from stringx.core.basemodule import BaseModule
 from stringx.core.retry import retry_operation
 from stringx.core.user_agent_generator import UserAgentGenerator
 
+
+# Pool para os dois hosts de busca do Yahoo; com HTTP/2 as páginas de cada
+# host são multiplexadas em uma única conexão
+_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=60)
+
+# URL de destino entre os segmentos /R*= do redirecionador do Yahoo
+_URL_RE = re.compile(rb'/R[A-Za-z0-9]+=(https?[^/]+)/R[A-Za-z0-9]+=')
+# Domínios descartados dos resultados, compilados em uma única alternação
+_BLOCK_LIST = (
+    'bing.com', 'microsoft.com', 'msn.com', 'live.com', 'outlook.com',
+    'hotmail.com', 'office.com', 'skype.com', 'xbox.com', 'windows.com',
+    'microsoftonline.com', 'azurewebsites.net', 'uol.com.br', 'play.google.com',
+    'yahoo.com'
+)
+_BLOCK_RE = re.compile('|'.join(map(re.escape, _BLOCK_LIST)))
+
+# URLs extraídas por impressão digital de página, compartilhadas entre buscas
+# (dorks parecidos em sequência costumam repetir páginas de resultado). Só é
+# acessado na thread do event loop compartilhado
+_PAGE_CACHE: Dict[bytes, Tuple[str, ...]] = {}
+_PAGE_CACHE_SIZE = 256
+
+
+def _page_digest(content: bytes) -> bytes:
+    """
+    Calcula a impressão digital de 64 bits do corpo de uma página.
+    
+    Args:
+        content: Corpo bruto da resposta
+        
+    Returns:
+        Digest BLAKE2b de 8 bytes
+    """
+    return hashlib.blake2b(content, digest_size=8).digest()
+
+
 class YahooDorker(BaseModule):
     """
     Módulo para dorking usando motor de busca Yahoo.
@@ -52,8 +93,6 @@ class YahooDorker(BaseModule):
         Inicializa o módulo de dorking Yahoo.
         """
         super().__init__()
-        # Instância do cliente HTTP assíncrono
-        self.request = HTTPClient()
         # Metadados do módulo
         self.meta = {
             'name': 'Yahoo Dorking Tool',
@@ -88,6 +127,16 @@ class YahooDorker(BaseModule):
     
 
     
+    @property
+    def request(self):
+        """
+        Cliente HTTP persistente compartilhado pelo processo.
+        
+        Não é armazenado na instância para que o módulo continue podendo ser
+        copiado (deepcopy/pickle) pelo carregador de módulos.
+        """
+        return get_shared_runtime()[1]
+    
     def run(self) -> None:
         """
         Executa busca de dorks no Yahoo.
@@ -118,8 +167,8 @@ class YahooDorker(BaseModule):
             
             self.log_debug(f"Iniciando busca para dork: {dork}")
             
-            # Coletando resultados
-            results = self._search(dork)
+            # Coletando resultados (busca e pausa rodam no loop compartilhado)
+            results = run_in_shared_loop(self._search(dork))
             
             if not results:
                 self.log_debug("Nenhum resultado encontrado")
@@ -140,7 +189,7 @@ class YahooDorker(BaseModule):
             self.handle_error(e, "Erro Yahoo")
     
     @retry_operation
-    def _search(self, dork: str) -> List[str]:
+    async def _search(self, dork: str) -> List[str]:
         """
         Realiza busca no Yahoo usando diferentes URLs e extrai resultados.
         
@@ -157,8 +206,10 @@ class YahooDorker(BaseModule):
             ReadTimeout, ConnectTimeout, TimeoutException: Se a requisição exceder o tempo limite
         """
    
-        # Lista para armazenar resultados
-        results = []
+        # Conjunto de resultados já vistos (deduplicação por hash)
+        seen: Set[str] = set()
+        # Impressões digitais das páginas já processadas
+        page_digests: Set[bytes] = set()
         
         # Codificar a query
         encoded_dork = quote_plus(dork)
@@ -177,46 +228,63 @@ class YahooDorker(BaseModule):
             'proxy': self.options.get('proxy') if self.options.get('proxy') else None,
             'timeout': self.options.get('timeout', 30),
             'follow_redirects': True,
+            'http2': HTTP2_AVAILABLE,
+            'limits': _LIMITS,
         }
         
+        # Montar todas as URLs de paginação para um único lote
+        search_urls = [template.format(DORK=encoded_dork) for template in self.search_url_templates]
+        
         try:
-            # Usar o método assíncrono do HTTPClient
-            for idx, template in enumerate(self.search_url_templates):
-                search_url = template.format(DORK=encoded_dork)
-                self.log_debug(f"Consultando URL #{idx+1}: {search_url}")
-                
+            # Disparar todas as requisições concorrentemente no loop compartilhado,
+            # reaproveitando conexões (e handshakes TLS) entre páginas e dorks
+            self.log_debug(f"Consultando {len(search_urls)} URLs em lote")
+            responses = await self.request.send_request(search_urls, **kwargs)
+            
+            for idx, response in enumerate(responses):
                 try:
-                    # Executar requisição assíncrona
-                    async def make_request():
-                        return await self.request.send_request([search_url], **kwargs)
-                    response = asyncio.run(make_request())[0]
+                    # Falhas individuais chegam como exceções no lugar da resposta
+                    if isinstance(response, Exception):
+                        self.log_debug(f"Erro de requisição na URL #{idx+1}: {str(response)}")
+                        continue
                     
                     if response.status_code != 200:
                         self.log_debug(f"Status não-OK: {response.status_code}")
                         continue
                     
-                    # Extrair resultados
-                    page_results = set(self._extract_urls(response.text))
+                    # Páginas idênticas (paginação além do fim) não são reprocessadas
+                    digest = _page_digest(response.content)
+                    if digest in page_digests:
+                        self.log_debug(f"Página #{idx+1} idêntica a uma anterior, ignorada")
+                        continue
+                    page_digests.add(digest)
+                    
+                    # Extrair resultados (páginas já vistas em outras buscas vêm do cache)
+                    page_results = _PAGE_CACHE.get(digest)
+                    if page_results is None:
+                        page_results = tuple(self._extract_urls(response.content))
+                        _PAGE_CACHE[digest] = page_results
+                        # Descarta a entrada mais antiga ao exceder o limite
+                        if len(_PAGE_CACHE) > _PAGE_CACHE_SIZE:
+                            _PAGE_CACHE.pop(next(iter(_PAGE_CACHE)))
+                    else:
+                        self.log_debug(f"Página #{idx+1} em cache")
                     self.log_debug(f"Extraídos {len(page_results)} URLs desta página")
                     
                     # Filtrar duplicidades
-                    for url in page_results:
-                        if url and url not in results:
-                            results.append(url)
+                    seen.update(page_results)
                     
-                    # Respeitar delay entre requisições
-                    delay = self.options.get('delay', 2) + random.uniform(0.5, 1.5)
-                    self.log_debug(f"Aguardando {delay:.2f}s antes da próxima requisição")
-                    time.sleep(delay)
-                    
-                except RequestException as e:
-                    self.log_debug(f"Erro de requisição na URL #{idx+1}: {str(e)}")
-                    continue
                 except Exception as e:
                     self.log_debug(f"Erro ao processar URL #{idx+1}: {str(e)}")
                     continue
             
-            return sorted(list(set(results)))  # Garantir que não haja duplicatas
+            # Respeitar delay após o lote antes da próxima busca, sem bloquear
+            # o event loop (outros módulos seguem progredindo durante a pausa)
+            delay = self.options.get('delay', 2) + random.uniform(0.5, 1.5)
+            self.log_debug(f"Aguardando {delay:.2f}s antes da próxima requisição")
+            await asyncio.sleep(delay)
+            
+            return sorted(seen)
                 
         except ConnectError as e:
             self.log_debug(f"Erro de conexão: {str(e)}")
@@ -238,47 +306,43 @@ class YahooDorker(BaseModule):
         Returns:
             True se a URL for válida e não bloqueada, False caso contrário
         """
-        block_list = [
-            'bing.com', 'microsoft.com', 'msn.com', 'live.com', 'outlook.com',
-            'hotmail.com', 'office.com', 'skype.com', 'xbox.com', 'windows.com',
-            'microsoftonline.com', 'azurewebsites.net', 'uol.com.br', 'play.google.com',
-            'yahoo.com'
-        ]
+        return bool(url) and url.startswith('http') and not _BLOCK_RE.search(url)
 
-        if not url:
-            return False
-
-        for block in block_list:
-            if block in url:
-                return False
-            
-        if url.startswith('http'):
-            return True
-        return False
-
-    def _extract_urls(self, html_content: str) -> List[str]:
+    def _extract_urls(self, html_content: bytes) -> List[str]:
         """
-        Extrai URLs dos resultados de busca do Yahoo usando regex.
+        Extrai URLs dos resultados de busca do Yahoo.
+        
+        Com o selectolax instalado, os links de resultado são selecionados
+        diretamente via CSS e a URL de destino é lida do segmento /RU= do
+        redirecionador do Yahoo; sem ele, usa regex sobre o HTML. Ambos
+        trabalham sobre os bytes da resposta, sem decodificar a página
+        inteira: só as URLs encontradas são decodificadas.
         
         Args:
-            html_content: Conteúdo HTML da página de resultados
+            html_content: Corpo bruto (bytes) da página de resultados
             
         Returns:
             Lista de URLs extraídas e decodificadas
         """
         results = []
-        # Regex para capturar URLs entre R*= e /R*=
-        pattern = r'\/R[A-Za-z0-9]+=([http][^\/]+)\/R[A-Za-z0-9]+='
-        
-        # Encontrar todas as correspondências
-        matches = re.findall(pattern, html_content)
+        if LexborHTMLParser is not None:
+            matches = []
+            for anchor in LexborHTMLParser(html_content).css('a[href*="/RU="]'):
+                href = anchor.attributes.get('href')
+                if href:
+                    matches.append(href.split('/RU=', 1)[1].split('/RK=', 1)[0])
+        else:
+            matches = [m.decode('utf-8', 'ignore') for m in _URL_RE.findall(html_content)]
         self.log_debug(f"Encontradas {len(matches)} URLs no padrão")
         
-        # Decodificar as URLs encontradas (converter %3a para :, %2f para /, etc)
+        # Decodificar as URLs encontradas (converter %3a para :, %2f para /, etc).
+        # URLs bloqueadas são descartadas antes do unquote; a re-checagem após
+        # decodificar pega domínios bloqueados que vieram percent-encoded
         for url in matches:
             if self._is_valid_url(url):
                 decoded_url = unquote(url)
-                results.append(decoded_url)
+                if not _BLOCK_RE.search(decoded_url):
+                    results.append(decoded_url)
                 
         return results
 
@@ -6,11 +6,32 @@ via Discord Webhook, permitindo notificações e compartilhamento de dados
 extraídos pelo String-X.
 """
 import json
-import urllib.parse
-import urllib.request
+from datetime import datetime, timezone
+
+import httpx
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from stringx.core.format import Format
 from stringx.core.basemodule import BaseModule
+from stringx.core.http_async import HTTP2_AVAILABLE, get_shared_runtime, run_in_shared_loop
+
+# Codificador JSON: orjson já devolve bytes; a biblioteca padrão é o fallback
+if orjson is not None:
+    _json_dumps = orjson.dumps
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Título fixo do embed
+_EMBED_TITLE = "[+] String-X Results"
+# Bytes de dados na descrição do embed (limite do Discord, com folga para a cerca ```)
+_DESCRIPTION_LIMIT = 1900
+
+# Poucas conexões mantidas vivas para o host do webhook
+_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=60)
 
 class DiscordOutput(BaseModule):
     """
@@ -68,18 +89,24 @@ class DiscordOutput(BaseModule):
             
             self.log_debug("[*] Preparando mensagem para Discord")
             
+            # Limite aplicado sobre os bytes UTF-8, medidos uma única vez; o
+            # corte nunca deixa um caractere multibyte pela metade
+            raw = data.encode('utf-8')
+            total_bytes = len(raw)
+            truncated = raw[:_DESCRIPTION_LIMIT].decode('utf-8', errors='ignore')
+            
             # Preparar embed
             embed = {
-                "title": "[+] String-X Results",
-                "description": f"```\n{data[:1900]}\n```",  # Limite do Discord
+                "title": _EMBED_TITLE,
+                "description": f"```\n{truncated}\n```",
                 "color": self.options.get('color', 0x00ff00),
                 "timestamp": self._get_current_timestamp()
             }
             
             # Se os dados forem muito longos, adicionar nota
-            if len(data) > 1900:
+            if total_bytes > _DESCRIPTION_LIMIT:
                 embed["footer"] = {
-                    "text": f"Dados truncados. Total: {len(data)} caracteres"
+                    "text": f"Dados truncados. Total: {total_bytes} bytes"
                 }
             
             # Payload do webhook
@@ -94,27 +121,32 @@ class DiscordOutput(BaseModule):
                 payload["avatar_url"] = avatar_url
             
             # Codificar dados
-            data_encoded = json.dumps(payload).encode('utf-8')
+            data_encoded = _json_dumps(payload)
             
-            self.log_debug(f"[*] Enviando dados para Discord: {len(data)} caracteres")
+            self.log_debug(f"[*] Enviando dados para Discord: {total_bytes} bytes")
             
-            # Fazer requisição
-            req = urllib.request.Request(webhook_url, data=data_encoded, method='POST')
-            req.add_header('Content-Type', 'application/json')
+            # Fazer requisição pela sessão persistente compartilhada: envios
+            # seguintes reaproveitam a conexão (e o handshake TLS)
+            session = get_shared_runtime()[1].get_session(limits=_LIMITS, http2=HTTP2_AVAILABLE)
+            response = run_in_shared_loop(session.post(
+                webhook_url,
+                content=data_encoded,
+                headers={'Content-Type': 'application/json'},
+                timeout=10
+            ))
+            response.raise_for_status()
             
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 204:
-                    self.log_debug("[+] Mensagem enviada via Discord")
-                    self.set_result(f"Discord: Mensagem enviada com sucesso")
-                else:
-                    self.log_debug(f"[x] Erro Discord: Status {response.status}")
+            if response.status_code == 204:
+                self.log_debug("[+] Mensagem enviada via Discord")
+                self.set_result(f"Discord: Mensagem enviada com sucesso")
+            else:
+                self.log_debug(f"[x] Erro Discord: Status {response.status_code}")
                     
         except Exception as e:
             self.handle_error(e, "Erro ao enviar mensagem para Discord")
     
     def _get_current_timestamp(self):
         """
-        Retorna timestamp atual no formato ISO.
+        Retorna timestamp atual (UTC) no formato ISO, com precisão de segundos.
         """
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        return datetime.now(timezone.utc).isoformat(timespec='seconds')
@@ -14,13 +14,26 @@ que permite:
 - Enumeração de arquivos e diretórios potencialmente sensíveis
 """
 # Bibliotecas padrão
+import re
 import ftplib
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
 
 # Módulos locais
 from stringx.core.basemodule import BaseModule
 
+# Linhas da listagem exibidas no resultado
+_LIST_LIMIT = 10
+# Separadores de uma lista de hosts em 'data' e limite de conexões simultâneas
+_HOSTS_SPLIT_RE = re.compile(r'[,\n]')
+_MAX_WORKERS = 16
+
+
+class _ListingDone(Exception):
+    """Interrompe o LIST após a última linha necessária."""
+
+
 class FTPConnector(BaseModule):
     """
     Módulo para conexões FTP.
@@ -50,6 +63,7 @@ class FTPConnector(BaseModule):
             'username': self.setting.STRX_FTP_USERNAME,   # Nome de usuário para autenticação
             'password': self.setting.STRX_FTP_PASS,  # Senha para autenticação
             'timeout': self.setting.STRX_FTP_TIMEOUT,            # Timeout para conexão e operações
+            'connect_timeout': 3,     # Timeout da sondagem TCP antes do login
             'passive': True,          # Usar modo passivo
             'list_files': True,       # Listar arquivos no diretório atual            'debug': False,           # Modo de debug para mostrar informações detalhadas
             'retry': 0,               # Número de tentativas de requisição
@@ -63,16 +77,12 @@ class FTPConnector(BaseModule):
         Executa a conexão FTP e operações especificadas.
         
         Esta função tenta estabelecer conexão FTP com o host especificado usando
-        credenciais fornecidas e lista arquivos/diretórios.
+        credenciais fornecidas e lista arquivos/diretórios. 'data' também aceita
+        vários hosts separados por vírgula ou quebra de linha, verificados
+        concorrentemente (o FTP é dominado por latência de rede).
         
         Returns:
             None: Os resultados são armazenados através do método set_result
-            
-        Raises:
-            ValueError: Se os parâmetros de conexão forem inválidos
-            ftplib.error_perm: Se ocorrer erro de permissão (credenciais inválidas)
-            socket.error: Se ocorrer erro de conexão
-            TimeoutError: Se a conexão exceder o tempo limite
         """
         # Limpar resultados anteriores para evitar acúmulo
         self._result[self._get_cls_name()].clear()
@@ -80,7 +90,29 @@ class FTPConnector(BaseModule):
         if not target:
             self.log_debug("[!] Nenhum host alvo especificado")
             return
+        
+        hosts = [h.strip() for h in _HOSTS_SPLIT_RE.split(target) if h.strip()]
+        if len(hosts) == 1:
+            results = [self._probe_single(hosts[0])]
+        else:
+            self.log_debug(f"[*] Verificando {len(hosts)} hosts FTP")
+            with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(hosts))) as executor:
+                results = list(executor.map(self._probe_single, hosts))
+        
+        for result in results:
+            if result:
+                self.set_result(result)
+    
+    def _probe_single(self, target: str) -> Optional[str]:
+        """
+        Conecta a um único host FTP, faz login e lista o diretório atual.
+        
+        Args:
+            target: host:port ou apenas host
             
+        Returns:
+            Texto do resultado, ou None se a conexão falhar (o erro é registrado)
+        """
         # Parse host:port
         if ':' in target:
             host, port = target.split(':', 1)
@@ -99,6 +131,17 @@ class FTPConnector(BaseModule):
         
         self.log_debug(f"[*] Conectando a {host}:{port} como {username}")
         
+        # Sondagem rápida da porta: em varreduras com muitos hosts, hosts
+        # inativos falham em connect_timeout segundos em vez de prender o
+        # worker pelo timeout completo do ftplib
+        try:
+            probe_timeout = min(self.options.get('connect_timeout', 3), timeout)
+            with socket.create_connection((host, port), timeout=probe_timeout):
+                pass
+        except OSError as e:
+            self.handle_error(e, f"FTP port closed - {host}:{port}")
+            return None
+        
         try:
             # Estabelecer conexão FTP
             ftp = ftplib.FTP()
@@ -118,46 +161,49 @@ class FTPConnector(BaseModule):
             welcome = ftp.getwelcome()
             self.log_debug(f"[*] Mensagem de boas-vindas: {welcome}")
             
-            result = f"FTP Success - {host}:{port}\n"
-            result += f"Welcome: {welcome}\n"
+            parts = [f"FTP Success - {host}:{port}", f"Welcome: {welcome}"]
+            
+            # Obter diretório atual antes da listagem: um LIST abortado pode
+            # deixar respostas pendentes no canal de controle
+            try:
+                pwd = ftp.pwd()
+                self.log_debug(f"[*] Diretório atual: {pwd}")
+            except ftplib.error_perm:
+                self.log_debug("[x] Não foi possível obter o diretório atual")
+                pwd = None
             
             # Listar arquivos se solicitado
             if self.options.get('list_files', True):
                 self.log_debug("[*] Listando arquivos no diretório atual")
                 try:
-                    files = []
-                    ftp.retrlines('LIST', files.append)
+                    files = self._list_files(ftp)
                     
                     if files:
                         self.log_debug(f"[+] Encontrados {len(files)} arquivos/diretórios")
-                        result += f"Directory listing:\n"
-                        for file_line in files[:10]:  # Limitar a 10 linhas
-                            result += f"  {file_line}\n"
-                        if len(files) > 10:
-                            result += f"  ... and {len(files) - 10} more files\n"
+                        parts.append("Directory listing:")
+                        parts.extend(f"  {file_line}" for file_line in files[:_LIST_LIMIT])
+                        if len(files) > _LIST_LIMIT:
+                            parts.append("  ... more files")
                     else:
                         self.log_debug("[!] Diretório vazio")
-                        result += "Directory is empty\n"
+                        parts.append("Directory is empty")
                 except ftplib.error_perm as e:
                     self.handle_error(e, f"Erro de permissão ao listar arquivos")
-                    result += f"Could not list files: Permission denied\n"
+                    parts.append("Could not list files: Permission denied")
                 except Exception as e:
                     self.handle_error(e, "Erro ao listar arquivos FTP")
-                    result += f"Could not list files: {str(e)}\n"
+                    parts.append(f"Could not list files: {str(e)}")
             
-            # Obter diretório atual
-            try:
-                pwd = ftp.pwd()
-                self.log_debug(f"[*] Diretório atual: {pwd}")
-                result += f"Current directory: {pwd}\n"
-            except ftplib.error_perm:
-                self.log_debug("[x] Não foi possível obter o diretório atual")
-                pass
+            if pwd is not None:
+                parts.append(f"Current directory: {pwd}")
             
             # Encerrar conexão corretamente
             self.log_debug("[*] Encerrando conexão")
-            ftp.quit()
-            self.set_result(result)
+            try:
+                ftp.quit()
+            except ftplib.all_errors:
+                ftp.close()
+            return '\n'.join(parts) + '\n'
             
         except ftplib.error_perm as e:
             self.handle_error(e, f"Erro de permissão FTP - {host}:{port}")
@@ -169,3 +215,35 @@ class FTPConnector(BaseModule):
             self.handle_error(e, f"Erro de parâmetro FTP - {host}:{port}")
         except Exception as e:
             self.handle_error(e, "Erro inesperado na conexão FTP")
+        return None
+    
+    @staticmethod
+    def _list_files(ftp: ftplib.FTP) -> List[str]:
+        """
+        Lista o diretório atual lendo no máximo _LIST_LIMIT + 1 linhas.
+        
+        A transferência é interrompida assim que a linha excedente chega
+        (ela só indica que há mais arquivos), evitando baixar e manter em
+        memória listagens inteiras de diretórios grandes.
+        
+        Args:
+            ftp: Conexão FTP autenticada
+            
+        Returns:
+            Linhas do LIST; mais de _LIST_LIMIT linhas indica listagem truncada
+        """
+        files = []
+        
+        def _collect(line: str) -> None:
+            files.append(line)
+            if len(files) > _LIST_LIMIT:
+                raise _ListingDone
+        
+        try:
+            ftp.retrlines('LIST', _collect)
+        except _ListingDone:
+            try:
+                ftp.abort()
+            except ftplib.all_errors:
+                pass
+        return files
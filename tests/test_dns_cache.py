@@ -0,0 +1,127 @@
+"""Tests for the in-process DNS cache and its httpcore backend"""
+import os
+import sys
+import time
+import asyncio
+
+import httpcore
+import pytest
+
+# Add src directory to Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from stringx.core.dns_cache import DNSCache, CachedDNSBackend, build_cached_transport
+
+
+class _FakeStream:
+    """Connected stream stub that records whether it was closed"""
+
+    def __init__(self, address):
+        self.address = address
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _FakeBackend:
+    """Network backend that refuses every address in `dead` and never answers `silent` ones"""
+
+    def __init__(self, dead=(), silent=()):
+        self.dead = set(dead)
+        self.silent = set(silent)
+        self.attempts = []
+        self.streams = []
+
+    async def connect_tcp(self, host, port, timeout=None, **kwargs):
+        self.attempts.append(host)
+        if host in self.silent:
+            # Pacotes descartados: só o timeout encerra a tentativa
+            await asyncio.sleep(3600 if timeout is None else timeout)
+            raise httpcore.ConnectTimeout(f"timed out {host}")
+        if host in self.dead:
+            raise httpcore.ConnectError(f"unreachable {host}")
+        stream = _FakeStream(host)
+        self.streams.append(stream)
+        return stream
+
+
+class TestCachedDNSBackend:
+    """Tests for connecting through cached addresses"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.cache = DNSCache()
+        self.cache._entries["example.com"] = (time.monotonic() + 60, ("2001:db8::1", "2001:db8::2", "192.0.2.1", "192.0.2.2"))
+        self.backend = CachedDNSBackend(self.cache)
+
+    def test_falls_back_to_next_address(self):
+        """Test that a refused address starts the next attempt right away, alternating families"""
+        self.backend._backend = _FakeBackend(dead={"2001:db8::1"})
+
+        stream = asyncio.run(self.backend.connect_tcp("example.com", 443))
+
+        assert stream.address == "192.0.2.1"
+        assert self.backend._backend.attempts == ["2001:db8::1", "192.0.2.1"]
+
+    def test_silent_address_only_costs_the_stagger_delay(self):
+        """Test that an address that never connects does not hold the connection for the timeout"""
+        self.backend._backend = _FakeBackend(silent={"2001:db8::1"})
+        started = time.monotonic()
+
+        stream = asyncio.run(self.backend.connect_tcp("example.com", 443, timeout=30))
+
+        assert stream.address == "192.0.2.1"
+        assert time.monotonic() - started < 1
+
+    def test_timeout_bounds_the_whole_race(self):
+        """Test that the timeout covers all attempts together, not each one in turn"""
+        self.backend._backend = _FakeBackend(silent={"2001:db8::1", "2001:db8::2", "192.0.2.1", "192.0.2.2"})
+        started = time.monotonic()
+
+        with pytest.raises(httpcore.ConnectTimeout):
+            asyncio.run(self.backend.connect_tcp("example.com", 443, timeout=1))
+
+        assert time.monotonic() - started < 1.5
+
+    def test_losing_connections_are_closed(self):
+        """Test that an attempt which connects while being cancelled is closed"""
+        class LateBackend(_FakeBackend):
+            async def connect_tcp(self, host, port, timeout=None, **kwargs):
+                if host != "2001:db8::1":
+                    return await super().connect_tcp(host, port, timeout=timeout, **kwargs)
+                try:
+                    await asyncio.sleep(3600)
+                except asyncio.CancelledError:
+                    # O handshake concluiu junto com o cancelamento
+                    return await super().connect_tcp(host, port, timeout=timeout, **kwargs)
+
+        self.backend._backend = LateBackend()
+
+        stream = asyncio.run(self.backend.connect_tcp("example.com", 443, timeout=5))
+
+        late = [s for s in self.backend._backend.streams if s is not stream]
+        assert stream.address == "192.0.2.1" and not stream.closed
+        assert [s.address for s in late] == ["2001:db8::1"]
+        assert late[0].closed
+
+    def test_raises_last_error_when_all_fail(self):
+        """Test that the last connection error is re-raised"""
+        self.backend._backend = _FakeBackend(dead={"2001:db8::1", "2001:db8::2", "192.0.2.1", "192.0.2.2"})
+
+        with pytest.raises(httpcore.ConnectError, match="192.0.2.2"):
+            asyncio.run(self.backend.connect_tcp("example.com", 443))
+
+    def test_ip_literal_is_not_resolved(self):
+        """Test that IP hosts are returned as a single address"""
+        assert asyncio.run(self.cache.resolve("192.0.2.10", 80)) == ("192.0.2.10",)
+
+
+class TestCachedTransport:
+    """Tests for the httpx internals the cached transport relies on"""
+
+    def test_backend_is_installed_in_the_pool(self):
+        """Test that httpx still exposes the pool's network backend"""
+        transport = build_cached_transport()
+
+        assert isinstance(transport._pool._network_backend, CachedDNSBackend)
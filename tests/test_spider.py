@@ -0,0 +1,129 @@
+"""Tests for web spider URL extraction"""
+import os
+import sys
+import asyncio
+
+import httpx
+import pytest
+
+# Add src directory to Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import stringx.utils.auxiliary.clc.spider as spider_module
+from stringx.utils.auxiliary.clc.spider import WebSpider
+
+_PAGES = {
+    "/": (200, '<a href="/about">a</a><a href="/blog">b</a>'),
+    "/about": (200, '<a href="/contact">c</a>'),
+    "/blog": (404, "missing"),
+    "/contact": (200, "end"),
+}
+
+
+def _handler(request):
+    """Serve the canned pages of https://example.com"""
+    status, body = _PAGES.get(request.url.path, (404, ""))
+    return httpx.Response(status, text=body, headers={"content-type": "text/html"})
+
+
+class TestExtractUrls:
+    """Tests for extracting URLs from page content"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.spider = WebSpider()
+        self.spider.options['include_external'] = True
+        self.spider.base_domain = "example.com"
+
+    def test_absolute_url_nested_in_attribute(self):
+        """Test that an absolute URL inside an attribute value is also collected"""
+        html = '<a href="/go?u=https://ext.com/x">go</a>'
+
+        urls = self.spider._extract_urls_from_content(html, "https://example.com/")
+
+        assert "https://example.com/go?u=https://ext.com/x" in urls
+        assert "https://ext.com/x" in urls
+
+    def test_meta_refresh_and_js_location(self):
+        """Test that meta refresh and location.href targets are collected"""
+        html = ('<meta http-equiv="refresh" content="0; url=/moved">'
+                '<script>location.href = "/next"</script>')
+
+        urls = self.spider._extract_urls_from_content(html, "https://example.com/")
+
+        assert {"https://example.com/moved", "https://example.com/next"} <= urls
+
+    def test_css_url_references(self):
+        """Test that CSS url(...) references are collected for stylesheets"""
+        css = 'body { background: url("/fonts/page") } .x { cursor: url(/c/handler) }'
+
+        urls = self.spider._extract_urls_from_content(css, "https://example.com/", kind='css')
+
+        assert {"https://example.com/fonts/page", "https://example.com/c/handler"} <= urls
+
+
+class TestStreaming:
+    """Tests for iter_urls() and run() over a mocked HTTP transport"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.spider = WebSpider()
+        self.spider.options['delay'] = 0
+        self.spider.options['depth'] = 2
+
+    def _mock_transport(self, monkeypatch):
+        """Route the spider's client through httpx.MockTransport"""
+        monkeypatch.setattr(spider_module, "build_cached_transport",
+                            lambda **kwargs: httpx.MockTransport(_handler))
+
+    async def _consume(self, start_url):
+        """Collect everything iter_urls() yields"""
+        return [item async for item in self.spider.iter_urls(start_url)]
+
+    def test_iter_urls_yields_status_and_resets_state(self, monkeypatch):
+        """Test that iter_urls() streams (url, status) and ignores earlier runs"""
+        self._mock_transport(monkeypatch)
+        self.spider.visited_urls.add("https://example.com/")
+        self.spider.collected_urls.add("https://stale.example.com/")
+
+        items = dict(asyncio.run(self._consume("https://example.com/")))
+
+        assert items == {
+            "https://example.com/": 200,
+            "https://example.com/about": 200,
+            "https://example.com/blog": 404,
+            "https://example.com/contact": "N/A",
+        }
+
+    def test_crawl_failure_is_raised(self, monkeypatch):
+        """Test that an exception in the crawl task reaches the caller"""
+        async def failing_crawl(start_url):
+            self.spider._url_stream.put_nowait((start_url, 200))
+            raise RuntimeError("crawl failed")
+
+        monkeypatch.setattr(self.spider, "_run_spider_async", failing_crawl)
+        received = []
+
+        async def consume():
+            async for item in self.spider.iter_urls("https://example.com/"):
+                received.append(item)
+
+        with pytest.raises(RuntimeError, match="crawl failed"):
+            asyncio.run(consume())
+        assert received == [("https://example.com/", 200)]
+
+    def test_run_writes_streamed_results(self, monkeypatch):
+        """Test that run() stores the lines produced by iter_urls()"""
+        self._mock_transport(monkeypatch)
+        monkeypatch.setattr(self.spider, "_setup_signal_handlers", lambda: None)
+        self.spider.options['data'] = "https://example.com/"
+        self.spider.options['sort_output'] = True
+
+        self.spider.run()
+
+        assert self.spider.get_result() == [
+            "https://example.com/; 200\n"
+            "https://example.com/about; 200\n"
+            "https://example.com/blog; 404\n"
+            "https://example.com/contact; N/A"
+        ]
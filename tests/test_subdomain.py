@@ -0,0 +1,99 @@
+"""Tests for subdomain enumerator parsing and scope filtering"""
+import os
+import sys
+
+import httpx
+
+# Add src directory to Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from stringx.utils.auxiliary.clc.subdomain import SubdomainEnum
+
+
+class TestScopeFilter:
+    """Tests for the target-domain scope filter"""
+
+    def test_keeps_domain_and_subdomains(self):
+        """Test that the apex and its subdomains are kept"""
+        names = ["example.com", "a.example.com", "b.c.example.com"]
+
+        result = SubdomainEnum._filter_scope(names, "example.com")
+        assert result == {"example.com", "a.example.com", "b.c.example.com"}
+
+    def test_rejects_lookalike_domains(self):
+        """Test that substring matches outside the domain are rejected"""
+        names = ["evilexample.com", "example.com.attacker.tld", "notexample.com"]
+
+        result = SubdomainEnum._filter_scope(names, "example.com")
+        assert result == set()
+
+    def test_normalizes_case_and_whitespace(self):
+        """Test that names are stripped, lowercased and deduplicated"""
+        names = [" A.Example.com ", "a.example.com\n", "", "   "]
+
+        result = SubdomainEnum._filter_scope(names, "Example.COM")
+        assert result == {"a.example.com"}
+
+
+class TestJsonParsers:
+    """Tests for JSON source parsing"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.module = SubdomainEnum()
+
+    def test_html_error_page_is_skipped(self):
+        """Test that non-JSON bodies (rate-limit pages) yield no results"""
+        response = httpx.Response(200, content=b"<html>Too many requests</html>")
+
+        assert self.module._parse_crtsh(response, "example.com") == set()
+
+    def test_truncated_json_is_skipped(self):
+        """Test that invalid JSON yields no results instead of raising"""
+        response = httpx.Response(200, content=b'["a.example.com"')
+
+        assert self.module._parse_anubis(response, "example.com") == set()
+
+    def test_crtsh_multiline_names(self):
+        """Test that crt.sh name_value entries with several names are split"""
+        body = b'[{"name_value": "a.example.com\\nb.example.com"}]'
+        response = httpx.Response(200, content=body)
+
+        result = self.module._parse_crtsh(response, "example.com")
+        assert result == {"a.example.com", "b.example.com"}
+
+    def test_html_content_type_is_skipped(self):
+        """Test that responses declared as HTML are not parsed as JSON"""
+        response = httpx.Response(
+            200, content=b'["a.example.com"]', headers={"content-type": "text/html; charset=utf-8"}
+        )
+
+        assert self.module._parse_anubis(response, "example.com") == set()
+
+
+class TestResultBuffer:
+    """Tests for storing enumeration results"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.module = SubdomainEnum()
+
+    def test_run_stores_one_unique_entry_per_subdomain(self):
+        """Test that merged source results are stored once per subdomain"""
+        async def fake_search(method, domain):
+            return {
+                "crtsh": ["a.example.com", "b.example.com"],
+                "certspotter": ["b.example.com", "c.example.com"],
+            }[method]
+
+        self.module._source_search = fake_search
+        self.module.options.update(data="Example.com", methods=["crtsh", "certspotter"], proxy="http://proxy")
+        self.module.run()
+
+        assert self.module.get_result() == ["a.example.com", "b.example.com", "c.example.com"]
+
+    def test_set_result_keeps_list_items_as_given(self):
+        """Test that the shared set_result still stores every list item"""
+        self.module.set_result(["a.example.com", "", "a.example.com"])
+
+        assert self.module.get_result() == ["a.example.com", "a.example.com"]
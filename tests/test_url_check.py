@@ -0,0 +1,120 @@
+"""Tests for URL checker input parsing and status filtering"""
+import asyncio
+import os
+import sys
+
+import httpx
+
+# Add src directory to Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from stringx.utils.auxiliary.clc.url_check import UrlChecker
+
+
+class TestStatusFilters:
+    """Tests for status_filter / exclude_status handling"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.checker = UrlChecker()
+
+    def test_status_filter_keeps_only_listed_codes(self):
+        """Test that only listed status codes are included"""
+        self.checker.options.update(status_filter="200, 301,abc")
+        self.checker._refresh_filters()
+
+        assert self.checker._should_include_status(200)
+        assert self.checker._should_include_status(301)
+        assert not self.checker._should_include_status(404)
+
+    def test_exclude_status_removes_codes(self):
+        """Test that excluded status codes are dropped"""
+        self.checker.options.update(exclude_status="404,500")
+        self.checker._refresh_filters()
+
+        assert self.checker._should_include_status(200)
+        assert not self.checker._should_include_status(404)
+
+    def test_unreachable_codes_excluded_by_default(self):
+        """Test that error codes are excluded unless requested"""
+        self.checker._refresh_filters()
+
+        assert not self.checker._should_include_status(0)
+        self.checker.options.update(include_errors=True)
+        self.checker._refresh_filters()
+        assert self.checker._should_include_status(-1)
+
+
+class TestUrlValidation:
+    """Tests for URL validation"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.checker = UrlChecker()
+
+    def test_structural_check(self):
+        """Test that only http(s) URLs with a host are accepted"""
+        assert self.checker._is_valid_url("http://example.com/path?q=1")
+        assert self.checker._is_valid_url("https://10.0.0.1:8443")
+        assert not self.checker._is_valid_url("ftp://example.com")
+        assert not self.checker._is_valid_url("http://")
+        assert not self.checker._is_valid_url("example.com")
+
+    def test_strict_validation_checks_host(self):
+        """Test that strict validation rejects hosts without a TLD"""
+        self.checker.options.update(strict_validation=True)
+
+        assert self.checker._is_valid_url("http://example.com")
+        assert not self.checker._is_valid_url("http://intranet")
+
+    def test_list_input_is_validated_item_by_item(self):
+        """Test that list input skips extraction but is validated and deduplicated"""
+        urls = [" http://a.example.com ", "not a url", "http://a.example.com", "https://b.example.com/x"]
+
+        result = self.checker._parse_urls_from_input(urls)
+        assert result == ["http://a.example.com", "https://b.example.com/x"]
+
+
+class TestCheckUrlStatus:
+    """Tests for the single-URL status probe"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.checker = UrlChecker()
+
+    def _run(self, handler):
+        """Run _check_url_status against a mock transport"""
+        async def check():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+                return await self.checker._check_url_status(session, "http://example.com/", "HEAD")
+        return asyncio.run(check())
+
+    def test_returns_status_triple(self):
+        """Test that a response yields (url, status, final_url)"""
+        result = self._run(lambda request: httpx.Response(204))
+
+        assert result == ("http://example.com/", 204, "http://example.com/")
+
+    def test_request_errors_return_triple(self):
+        """Test that every error path yields the same 3-tuple shape"""
+        def fail(request):
+            raise httpx.ReadError("boom", request=request)
+
+        result = self._run(fail)
+        assert result == ("http://example.com/", -1, "http://example.com/")
+
+    def test_final_url_follows_redirect_history(self):
+        """Test that final_url is only rewritten after a followed redirect"""
+        def handler(request):
+            if request.url.path == "/":
+                return httpx.Response(301, headers={"location": "http://example.com/home"})
+            return httpx.Response(200)
+
+        async def check():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+                return await self.checker._check_url_status(
+                    session, "http://example.com", "GET", request_kwargs={"follow_redirects": True}
+                )
+
+        assert asyncio.run(check()) == ("http://example.com", 200, "http://example.com/home")
+        assert self._run(lambda request: httpx.Response(200))[2] == "http://example.com/"
@@ -0,0 +1,47 @@
+"""Tests for VirusTotal collector input handling"""
+import os
+import sys
+
+# Add src directory to Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from stringx.utils.auxiliary.clc.virustotal import VirusTotalCollector, _normalize_target
+
+
+class TestResourceTypeDetection:
+    """Tests for automatic resource type detection"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.module = VirusTotalCollector()
+
+    def test_hashes_are_files(self):
+        """Test that MD5, SHA1 and SHA256 hex digests are detected as files"""
+        for digest in ("d41d8cd98f00b204e9800998ecf8427e", "a" * 40, "F" * 64):
+            assert self.module._detect_resource_type(digest) == 'file'
+
+    def test_non_hex_or_wrong_length_is_not_a_hash(self):
+        """Test that near-miss hashes are not detected as files"""
+        assert self.module._detect_resource_type("g" * 32) == 'unknown'
+        assert self.module._detect_resource_type("a" * 33) == 'unknown'
+
+    def test_url_ip_and_domain(self):
+        """Test detection of URLs, IPv4 addresses and domains"""
+        assert self.module._detect_resource_type("https://example.com/x") == 'url'
+        assert self.module._detect_resource_type("8.8.8.8") == 'ip'
+        assert self.module._detect_resource_type("example.com") == 'domain'
+
+
+class TestTargetNormalization:
+    """Tests for target normalization before querying"""
+
+    def test_equivalent_targets_share_a_canonical_form(self):
+        """Test that case, trailing dots and fragments do not create new targets"""
+        assert _normalize_target("Example.COM.", 'domain') == "example.com"
+        assert _normalize_target("HTTPS://Example.com/Path#frag", 'url') == "https://example.com/Path"
+        assert _normalize_target("D41D8CD98F00B204E9800998ECF8427E", 'file') == "d41d8cd98f00b204e9800998ecf8427e"
+
+    def test_idn_domains_and_invalid_ips(self):
+        """Test IDN conversion and that unparsable input is kept as is"""
+        assert _normalize_target("ção.com", 'domain') == "xn--o-xfal.com"
+        assert _normalize_target("999.1.1.1", 'ip') == "999.1.1.1"
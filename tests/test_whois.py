@@ -0,0 +1,95 @@
+"""Tests for the asynchronous WHOIS client"""
+import os
+import sys
+import asyncio
+import importlib
+
+# Add src directory to Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import stringx.utils.auxiliary.clc.whois as whois_module
+from stringx.utils.auxiliary.clc.whois import WhoisInfo, _format_query, _normalize_domain
+
+_REGISTRY = "whois.verisign-grs.com"
+
+
+class TestPythonWhoisCompat:
+    """Tests for importing under the oldest python-whois allowed by pyproject.toml"""
+
+    def test_imports_without_whois_exceptions(self, monkeypatch):
+        """Test that python-whois 0.8.0 (PywhoisError in whois.parser) is supported"""
+        class LegacyPywhoisError(Exception):
+            pass
+
+        # 0.8.0 não tem whois.exceptions e define a exceção em whois.parser
+        monkeypatch.setitem(sys.modules, "whois.exceptions", None)
+        monkeypatch.setattr(whois_module.whois.parser, "PywhoisError", LegacyPywhoisError, raising=False)
+        try:
+            legacy = importlib.reload(whois_module)
+            assert legacy.PywhoisError is LegacyPywhoisError
+        finally:
+            monkeypatch.undo()
+            importlib.reload(whois_module)
+
+
+class TestDomainNormalization:
+    """Tests for reducing input to the registrable domain"""
+
+    def test_subdomains_are_reduced(self):
+        """Test that subdomains and URLs become the registrable domain"""
+        assert _normalize_domain("WWW.Example.com.") == "example.com"
+        assert _normalize_domain("sub.example.co.uk") == "example.co.uk"
+        assert _normalize_domain("https://www.example.com/path") == "example.com"
+
+    def test_ips_and_idn_domains(self):
+        """Test that IPs are kept and IDN domains become IDNA"""
+        assert _normalize_domain("8.8.8.8") == "8.8.8.8"
+        assert _normalize_domain("www.café.com") == "xn--caf-dma.com"
+
+    def test_server_specific_query_syntax(self):
+        """Test the DENIC, DK Hostmaster and JPRS query formats"""
+        assert _format_query("whois.denic.de", "example.de") == "-T dn,ace -C UTF-8 example.de"
+        assert _format_query("whois.dk-hostmaster.dk", "example.dk") == " --show-handles example.dk"
+        assert _format_query("whois.jprs.jp", "example.jp") == "example.jp/e"
+        assert _format_query(_REGISTRY, "example.com") == "example.com"
+
+
+class TestWhoisLookup:
+    """Tests for lookups with the TCP replies stubbed"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.module = WhoisInfo()
+        self.queries = []
+        whois_module._TLD_SERVERS.clear()
+
+    def _stub(self, monkeypatch):
+        """Replace the TCP query with canned IANA/registry replies"""
+        async def fake_query(server, query, timeout):
+            self.queries.append((server, query))
+            if server == whois_module._IANA_WHOIS:
+                return f"refer:        {_REGISTRY}\n"
+            if query != "example.com":
+                return f'No match for "{query.upper()}".\n'
+            return "Domain Name: EXAMPLE.COM\nRegistrar: Test Registrar\n"
+
+        monkeypatch.setattr(whois_module, "_whois_query", fake_query)
+
+    def test_subdomain_input_queries_registrable_domain(self, monkeypatch):
+        """Test that a subdomain input is looked up as its registrable domain"""
+        self._stub(monkeypatch)
+        domain = _normalize_domain("www.example.com")
+
+        entry = asyncio.run(self.module._whois_async(domain, 5))
+
+        assert (_REGISTRY, "example.com") in self.queries
+        assert entry.registrar == "Test Registrar"
+
+    def test_unparsed_reply_falls_back_to_python_whois(self, monkeypatch):
+        """Test that a reply rejected by the parser uses whois.whois"""
+        self._stub(monkeypatch)
+        monkeypatch.setattr(whois_module.whois, "whois", lambda domain: {"fallback": domain})
+
+        result = asyncio.run(self.module._whois_async("nomatch.com", 5))
+
+        assert result == {"fallback": "nomatch.com"}
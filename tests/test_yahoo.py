@@ -0,0 +1,38 @@
+"""Tests for Yahoo dorking result extraction"""
+import os
+import sys
+
+# Add src directory to Python path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from stringx.utils.auxiliary.clc.yahoo import YahooDorker
+
+
+def _result_link(target):
+    """Build a Yahoo redirect link (raw page bytes) wrapping an encoded target URL"""
+    return f'<a href="https://r.search.yahoo.com/_ylt=x/RV=2/RE=1/RO=10/RU={target}/RK=2/RS=abc-">r</a>'.encode()
+
+
+class TestExtractUrls:
+    """Tests for extracting result URLs from Yahoo pages"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.module = YahooDorker()
+
+    def test_decodes_result_urls(self):
+        """Test that wrapped result URLs are extracted and percent-decoded"""
+        html = _result_link("https%3a%2f%2fexample.com%2fpath%3fq%3d1")
+        assert self.module._extract_urls(html) == ["https://example.com/path?q=1"]
+
+    def test_blocked_domains_are_dropped(self):
+        """Test that block-listed domains are dropped, even when percent-encoded"""
+        html = (_result_link("https%3a%2f%2fwww.yahoo.com%2fx")
+                + _result_link("https%3a%2f%2fwww.bing%2ecom%2f")
+                + _result_link("https%3a%2f%2fexample.org%2f"))
+        assert self.module._extract_urls(html) == ["https://example.org/"]
+
+    def test_non_http_targets_are_ignored(self):
+        """Test that only http(s) targets are returned"""
+        html = _result_link("ftp%3a%2f%2fexample.com%2f") + _result_link("tel%3a123")
+        assert self.module._extract_urls(html) == []